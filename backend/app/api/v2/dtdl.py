@@ -282,7 +282,7 @@ async def validate_thing(
                     "severity": issue.severity.value,
                     "field": issue.field,
                     "message": issue.message,
-                    "suggestion": issue.suggestion
+                    "suggestion": issue.get_suggestion()
                 }
                 for issue in result.issues
             ],
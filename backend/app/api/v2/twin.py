@@ -338,14 +338,17 @@ async def export_twin_zip(
             ]
         }
 
-        interface_yaml = generator.generate_twin_interface_yaml(thing_description)
-        instance_yaml = generator.generate_twin_instance_yaml(thing_description)
-
-        # Create ZIP
+        # Create ZIP, dumping each YAML document straight into its entry
         zip_buffer = io.BytesIO()
         with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            zip_file.writestr(f"{interface_name}_interface.yaml", interface_yaml)
-            zip_file.writestr(f"{interface_name}_instance.yaml", instance_yaml)
+            with io.TextIOWrapper(
+                zip_file.open(f"{interface_name}_interface.yaml", "w"), encoding="utf-8"
+            ) as entry:
+                generator.generate_twin_interface_yaml(thing_description, stream=entry)
+            with io.TextIOWrapper(
+                zip_file.open(f"{interface_name}_instance.yaml", "w"), encoding="utf-8"
+            ) as entry:
+                generator.generate_twin_instance_yaml(thing_description, stream=entry)
 
         zip_buffer.seek(0)
 
@@ -5,4 +5,5 @@ from .twin_ontology import (
     get_twin_ontology,
     create_interface_uri, create_instance_uri,
     create_property_uri, create_relationship_uri, create_command_uri,
+    create_instance_relationship_uri,
 )
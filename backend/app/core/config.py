@@ -41,6 +41,9 @@ class Settings(BaseSettings):
     FUSEKI_DATASET: str = Field(default="twin-db")
     FUSEKI_USERNAME: str = Field(default="admin")
     FUSEKI_PASSWORD: str = Field(default="admin")
+    # Gzip named-graph uploads (Content-Encoding: gzip); the Fuseki server must
+    # be configured to inflate compressed request bodies
+    FUSEKI_GZIP_UPLOADS: bool = Field(default=False)
 
     # ============================================
     # TENANT CONFIGURATION (Simplified)
@@ -22,6 +22,8 @@ Properties:
 - hasInstanceRelationship: Links instance to another instance
 """
 
+from functools import lru_cache
+from hashlib import blake2b
 from rdflib import Namespace, Graph, RDF, RDFS, XSD, Literal, URIRef
 from typing import Dict, Any
 
@@ -256,31 +258,52 @@ def get_twin_ontology() -> Graph:
 # Helper Functions
 # ============================================================================
 
+@lru_cache(maxsize=4096)
 def create_interface_uri(interface_name: str) -> URIRef:
     """Create URI for a TwinInterface"""
     return URIRef(f"{TWIN_DATA}{interface_name}")
 
 
+@lru_cache(maxsize=4096)
 def create_instance_uri(instance_name: str) -> URIRef:
     """Create URI for a TwinInstance"""
     return URIRef(f"{TWIN_DATA}instance/{instance_name}")
 
 
+@lru_cache(maxsize=4096)
 def create_property_uri(interface_name: str, property_name: str) -> URIRef:
     """Create URI for a Property"""
     return URIRef(f"{TWIN_DATA}{interface_name}/property/{property_name}")
 
 
+@lru_cache(maxsize=4096)
 def create_relationship_uri(interface_name: str, relationship_name: str) -> URIRef:
     """Create URI for a Relationship"""
     return URIRef(f"{TWIN_DATA}{interface_name}/relationship/{relationship_name}")
 
 
+@lru_cache(maxsize=4096)
 def create_command_uri(interface_name: str, command_name: str) -> URIRef:
     """Create URI for a Command"""
     return URIRef(f"{TWIN_DATA}{interface_name}/command/{command_name}")
 
 
+def create_instance_relationship_uri(
+    instance_name: str,
+    relationship_name: str,
+    target_instance: str
+) -> URIRef:
+    """
+    Create a stable URI for a concrete relationship between two TwinInstances
+
+    Derived from a blake2b digest of (instance, relationship, target), so storing
+    the same instance twice yields the same node instead of a fresh blank node.
+    """
+    key = "\x1f".join((instance_name, relationship_name, target_instance)).encode("utf-8")
+    digest = blake2b(key, digest_size=12).hexdigest()
+    return URIRef(f"{TWIN_DATA}instance/{instance_name}/relationship/{digest}")
+
+
 # ============================================================================
 # Exports
 # ============================================================================
@@ -296,4 +319,5 @@ __all__ = [
     "create_property_uri",
     "create_relationship_uri",
     "create_command_uri",
+    "create_instance_relationship_uri",
 ]
@@ -12,12 +12,43 @@ Usage:
 
 import logging
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.services.dtdl_loader_service import get_dtdl_loader
 
 logger = logging.getLogger(__name__)
 
+# DTDL primitive schema -> Twin schema
+_PRIMITIVE_SCHEMA_MAPPING = {
+    "boolean": "boolean",
+    "date": "string",
+    "dateTime": "string",
+    "double": "double",
+    "duration": "string",
+    "float": "float",
+    "integer": "integer",
+    "long": "long",
+    "string": "string",
+    "time": "string",
+}
+
+# DTDL complex schema @type -> Twin schema
+_COMPLEX_SCHEMA_MAPPING = {
+    "Enum": "string",  # enum validation happens in app logic
+    "Object": "object",
+    "Array": "array",
+}
+
+# DTDL primitive schema -> YAML placeholder value
+_PRIMITIVE_DEFAULT_VALUES = {
+    "boolean": "false",
+    "double": "0.0",
+    "float": "0.0",
+    "integer": "0",
+    "long": "0",
+    "string": '""',
+}
+
 
 class DTDLConverterService:
     """Service for converting between DTDL and Twin formats"""
@@ -111,7 +142,7 @@ class DTDLConverterService:
         yaml_lines.append(f"  name: {thing_name}-interface")
         yaml_lines.append("  labels:")
         yaml_lines.append("    generated-by: dtdl-converter")
-        yaml_lines.append(f"    generated-at: {datetime.utcnow().isoformat()}")
+        yaml_lines.append(f"    generated-at: {datetime.now(timezone.utc).isoformat()}")
         if tenant_id:
             yaml_lines.append(f"    tenant: {tenant_id}")
         yaml_lines.append("  annotations:")
@@ -202,7 +233,7 @@ class DTDLConverterService:
         yaml_lines.append(f"  name: {thing_name}-001")
         yaml_lines.append("  labels:")
         yaml_lines.append("    generated-by: dtdl-converter")
-        yaml_lines.append(f"    generated-at: {datetime.utcnow().isoformat()}")
+        yaml_lines.append(f"    generated-at: {datetime.now(timezone.utc).isoformat()}")
         if tenant_id:
             yaml_lines.append(f"    tenant: {tenant_id}")
         yaml_lines.append("  annotations:")
@@ -248,32 +279,13 @@ class DTDLConverterService:
         """
         if isinstance(schema, str):
             # Simple primitive types
-            type_mapping = {
-                "boolean": "boolean",
-                "date": "string",
-                "dateTime": "string",
-                "double": "double",
-                "duration": "string",
-                "float": "float",
-                "integer": "integer",
-                "long": "long",
-                "string": "string",
-                "time": "string",
-            }
-            return type_mapping.get(schema, "string")
+            return _PRIMITIVE_SCHEMA_MAPPING.get(schema, "string")
 
         elif isinstance(schema, dict):
             schema_type = schema.get("@type")
-
-            if schema_type == "Enum":
-                # Return as string for Twin (enum validation in app logic)
-                return "string"
-            elif schema_type == "Object":
-                return "object"
-            elif schema_type == "Array":
-                return "array"
-            else:
-                return "string"
+            if isinstance(schema_type, str):
+                return _COMPLEX_SCHEMA_MAPPING.get(schema_type, "string")
+            return "string"
 
         return "string"
 
@@ -288,15 +300,7 @@ class DTDLConverterService:
             Default value appropriate for the schema type
         """
         if isinstance(schema, str):
-            defaults = {
-                "boolean": "false",
-                "double": "0.0",
-                "float": "0.0",
-                "integer": "0",
-                "long": "0",
-                "string": '""',
-            }
-            return defaults.get(schema, '""')
+            return _PRIMITIVE_DEFAULT_VALUES.get(schema, '""')
 
         elif isinstance(schema, dict):
             schema_type = schema.get("@type")
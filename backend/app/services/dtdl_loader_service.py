@@ -12,12 +12,30 @@ Usage:
 
 import json
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, List, Optional
 from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for parsing the registry and interface files; fall back to the
+# stdlib when it is not installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Content @types counted in get_interface_details' _summary
+_SUMMARY_CONTENT_TYPES = ("Telemetry", "Property", "Command", "Relationship", "Component")
+
+# DTMI format: dtmi:<path segments>;<version >= 1>, compiled once at import
+_DTMI_RE = re.compile(r"dtmi:[A-Za-z0-9_:]+;[1-9][0-9]*")
+
+# Threads used to read interface files concurrently at startup
+_PRELOAD_WORKERS = 8
+
 
 class DTDLLoaderService:
     """Service for loading and managing DTDL interface library"""
@@ -31,8 +49,15 @@ class DTDLLoaderService:
         self._interfaces_cache: Dict[str, Dict[str, Any]] = {}
         self._registry_cache: Optional[Dict[str, Any]] = None
 
+        # Search indexes over the registry (see _build_search_indexes)
+        self._thing_type_dtmis: Dict[str, FrozenSet[str]] = {}
+        self._domain_dtmis: Dict[str, FrozenSet[str]] = {}
+        self._interfaces_by_thing_type: Dict[str, List[Dict[str, Any]]] = {}
+        self._interfaces_by_domain: Dict[str, List[Dict[str, Any]]] = {}
+
         # Load registry and interfaces on initialization
         self._load_registry()
+        self._build_search_indexes()
         self._load_all_interfaces()
 
         logger.info(f"DTDL Loader initialized with {len(self._interfaces_cache)} interfaces")
@@ -50,11 +75,10 @@ class DTDLLoaderService:
                 }
                 return self._registry_cache
 
-            with open(self.registry_path, 'r', encoding='utf-8') as f:
-                self._registry_cache = json.load(f)
-                logger.info(f"Loaded registry v{self._registry_cache['version']} with "
-                           f"{len(self._registry_cache['interfaces'])} interface definitions")
-                return self._registry_cache
+            self._registry_cache = _json_loads(self.registry_path.read_bytes())
+            logger.info(f"Loaded registry v{self._registry_cache['version']} with "
+                       f"{len(self._registry_cache['interfaces'])} interface definitions")
+            return self._registry_cache
 
         except Exception as e:
             logger.error(f"Failed to load registry: {e}")
@@ -66,37 +90,94 @@ class DTDLLoaderService:
             }
             return self._registry_cache
 
+    def _build_search_indexes(self):
+        """
+        Index registry interfaces by thing type and domain
+
+        thingType matches either the interface's own thingType or its entry in
+        thingTypeMapping; domain matches domainMapping. Per-key interface
+        lists keep registry order so search results are ordered as before.
+        """
+        registry = self._registry_cache or {}
+        interfaces = registry.get("interfaces", [])
+
+        thing_type_dtmis: Dict[str, set] = {
+            thing_type: set(dtmis)
+            for thing_type, dtmis in registry.get("thingTypeMapping", {}).items()
+        }
+        self._domain_dtmis = {
+            domain: frozenset(dtmis)
+            for domain, dtmis in registry.get("domainMapping", {}).items()
+        }
+
+        for interface_def in interfaces:
+            direct_type = interface_def.get("thingType")
+            if direct_type:
+                thing_type_dtmis.setdefault(direct_type, set()).add(interface_def.get("dtmi"))
+        self._thing_type_dtmis = {
+            thing_type: frozenset(dtmis) for thing_type, dtmis in thing_type_dtmis.items()
+        }
+
+        self._interfaces_by_thing_type = {
+            thing_type: [
+                d for d in interfaces
+                if d.get("thingType") == thing_type or d.get("dtmi") in dtmis
+            ]
+            for thing_type, dtmis in self._thing_type_dtmis.items()
+        }
+        self._interfaces_by_domain = {
+            domain: [d for d in interfaces if d.get("dtmi") in dtmis]
+            for domain, dtmis in self._domain_dtmis.items()
+        }
+
     def _load_all_interfaces(self):
         """Load all DTDL interface files from library"""
         if not self._registry_cache:
             logger.warning("Registry not loaded, skipping interface loading")
             return
 
-        for interface_def in self._registry_cache.get("interfaces", []):
-            dtmi = interface_def.get("dtmi")
-            file_path = interface_def.get("filePath")
-
-            if not dtmi or not file_path:
-                continue
-
-            try:
-                full_path = self.library_path / file_path
-                if not full_path.exists():
-                    logger.warning(f"Interface file not found: {full_path}")
-                    continue
-
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    interface_json = json.load(f)
-
-                # Merge registry metadata with interface JSON
-                interface_json["_registry"] = interface_def
-                self._interfaces_cache[dtmi] = interface_json
+        entries = [
+            interface_def
+            for interface_def in self._registry_cache.get("interfaces", [])
+            if interface_def.get("dtmi") and interface_def.get("filePath")
+        ]
+        if not entries:
+            logger.warning("Registry lists no interface files")
+            return
 
-            except Exception as e:
-                logger.error(f"Failed to load interface {dtmi} from {file_path}: {e}")
+        # File reads release the GIL, so fan them out; results are consumed in
+        # registry order to keep the cache ordered as before
+        with ThreadPoolExecutor(max_workers=min(_PRELOAD_WORKERS, len(entries))) as executor:
+            futures = [
+                executor.submit(self._read_interface_file, self.library_path / d["filePath"])
+                for d in entries
+            ]
+
+            for interface_def, future in zip(entries, futures):
+                dtmi = interface_def["dtmi"]
+                file_path = interface_def["filePath"]
+                try:
+                    interface_json = future.result()
+                    if interface_json is None:
+                        logger.warning(f"Interface file not found: {self.library_path / file_path}")
+                        continue
+
+                    # Merge registry metadata with interface JSON
+                    interface_json["_registry"] = interface_def
+                    self._interfaces_cache[dtmi] = interface_json
+
+                except Exception as e:
+                    logger.error(f"Failed to load interface {dtmi} from {file_path}: {e}")
 
         logger.info(f"Successfully loaded {len(self._interfaces_cache)} DTDL interfaces")
 
+    @staticmethod
+    def _read_interface_file(full_path: Path) -> Optional[Dict[str, Any]]:
+        """Read one interface JSON file, or None if it does not exist"""
+        if not full_path.exists():
+            return None
+        return _json_loads(full_path.read_bytes())
+
     def get_interface(self, dtmi: str) -> Optional[Dict[str, Any]]:
         """
         Get DTDL interface by DTMI
@@ -144,24 +225,19 @@ class DTDLLoaderService:
         """
         results = []
 
-        for interface_def in self.list_all_interfaces():
-            # Filter by thing_type
-            if thing_type:
-                interface_thing_type = interface_def.get("thingType")
-                # Check direct thingType match
-                if interface_thing_type == thing_type:
-                    pass  # Direct match, include this interface
-                # Check thingTypeMapping
-                elif self._is_in_thing_type_mapping(interface_def["dtmi"], thing_type):
-                    pass  # Found in mapping, include this interface
-                else:
-                    # No match found, skip this interface
-                    continue
-
-            # Filter by domain
-            if domain:
-                if not self._is_in_domain_mapping(interface_def["dtmi"], domain):
-                    continue
+        # Start from the narrowest indexed candidate list (registry order)
+        if thing_type:
+            candidates = self._interfaces_by_thing_type.get(thing_type, [])
+        elif domain:
+            candidates = self._interfaces_by_domain.get(domain, [])
+        else:
+            candidates = self.list_all_interfaces()
+        domain_dtmis = self._domain_dtmis.get(domain, frozenset()) if thing_type and domain else None
+
+        for interface_def in candidates:
+            # Filter by domain (thing_type is already applied by the index)
+            if domain_dtmis is not None and interface_def.get("dtmi") not in domain_dtmis:
+                continue
 
             # Filter by category
             if category:
@@ -198,12 +274,7 @@ class DTDLLoaderService:
 
     def _is_in_domain_mapping(self, dtmi: str, domain: str) -> bool:
         """Check if DTMI is in domainMapping for given domain"""
-        if not self._registry_cache:
-            return False
-
-        mapping = self._registry_cache.get("domainMapping", {})
-        dtmi_list = mapping.get(domain, [])
-        return dtmi in dtmi_list
+        return dtmi in self._domain_dtmis.get(domain, ())
 
     def get_base_for_thing_type(self, thing_type: str) -> Optional[str]:
         """
@@ -256,25 +327,7 @@ class DTDLLoaderService:
         Returns:
             True if valid DTMI format
         """
-        # Basic DTMI validation: dtmi:<scheme>:<path>;<version>
-        if not dtmi.startswith("dtmi:"):
-            return False
-
-        if ";" not in dtmi:
-            return False
-
-        parts = dtmi.split(";")
-        if len(parts) != 2:
-            return False
-
-        try:
-            version = int(parts[1])
-            if version < 1:
-                return False
-        except ValueError:
-            return False
-
-        return True
+        return _DTMI_RE.fullmatch(dtmi) is not None
 
     def get_interface_details(self, dtmi: str) -> Optional[Dict[str, Any]]:
         """
@@ -290,21 +343,21 @@ class DTDLLoaderService:
         if not interface:
             return None
 
-        # Count contents by type
+        # Count contents by type in a single pass
         contents = interface.get("contents", [])
-        telemetry_count = len([c for c in contents if c.get("@type") == "Telemetry"])
-        property_count = len([c for c in contents if c.get("@type") == "Property"])
-        command_count = len([c for c in contents if c.get("@type") == "Command"])
-        relationship_count = len([c for c in contents if c.get("@type") == "Relationship"])
-        component_count = len([c for c in contents if c.get("@type") == "Component"])
+        counts = dict.fromkeys(_SUMMARY_CONTENT_TYPES, 0)
+        for c in contents:
+            content_type = c.get("@type")
+            if isinstance(content_type, str) and content_type in counts:
+                counts[content_type] += 1
 
         # Add summary
         interface["_summary"] = {
-            "telemetryCount": telemetry_count,
-            "propertyCount": property_count,
-            "commandCount": command_count,
-            "relationshipCount": relationship_count,
-            "componentCount": component_count,
+            "telemetryCount": counts["Telemetry"],
+            "propertyCount": counts["Property"],
+            "commandCount": counts["Command"],
+            "relationshipCount": counts["Relationship"],
+            "componentCount": counts["Component"],
             "totalContents": len(contents)
         }
 
@@ -316,6 +369,7 @@ class DTDLLoaderService:
         self._interfaces_cache.clear()
         self._registry_cache = None
         self._load_registry()
+        self._build_search_indexes()
         self._load_all_interfaces()
         logger.info("DTDL library reloaded successfully")
 
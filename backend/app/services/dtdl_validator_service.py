@@ -12,9 +12,10 @@ Usage:
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple, Union, Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 
 from app.services.dtdl_loader_service import get_dtdl_loader
 
@@ -34,7 +35,14 @@ class ValidationIssue:
     severity: ValidationSeverity
     field: str
     message: str
-    suggestion: Optional[str] = None
+    # Either a ready string or a zero-arg callable formatting it on demand
+    suggestion: Optional[Union[str, Callable[[], str]]] = None
+
+    def get_suggestion(self) -> Optional[str]:
+        """Return the suggestion text, formatting it lazily if needed"""
+        if callable(self.suggestion):
+            return self.suggestion()
+        return self.suggestion
 
 
 @dataclass
@@ -59,6 +67,9 @@ class DTDLValidatorService:
         """Initialize validator with DTDL loader"""
         self.loader = get_dtdl_loader()
 
+        # Cache for interface requirements: dtmi -> (interface JSON, requirements)
+        self._requirements_cache: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
     def validate_thing_against_interface(
         self,
         thing_data: Dict[str, Any],
@@ -73,6 +84,41 @@ class DTDLValidatorService:
             dtmi: DTDL interface identifier
             strict: If True, extra fields are treated as errors
 
+        Returns:
+            ValidationResult with compatibility score and issues
+        """
+        thing_telemetry = thing_data.get("telemetry", {})
+        thing_properties = thing_data.get("properties", {})
+        return self.validate_with_key_sets(
+            dtmi,
+            frozenset(thing_telemetry),
+            frozenset(thing_properties),
+            {"telemetry": thing_telemetry, "properties": thing_properties},
+            strict=strict
+        )
+
+    def validate_with_key_sets(
+        self,
+        dtmi: str,
+        telemetry_keys: FrozenSet[str],
+        property_keys: FrozenSet[str],
+        values: Dict[str, Dict[str, Any]],
+        strict: bool = False
+    ) -> ValidationResult:
+        """
+        Validate a Twin Thing whose field names have already been collected into sets
+
+        Lets callers scoring the same Thing against several interfaces build
+        the key sets once; extra fields are then a single set difference.
+
+        Args:
+            dtmi: DTDL interface identifier
+            telemetry_keys: Names of the Thing's telemetry fields
+            property_keys: Names of the Thing's property fields
+            values: Thing data with "telemetry" and "properties" dicts, used
+                for type checks and to keep extra fields in input order
+            strict: If True, extra fields are treated as errors
+
         Returns:
             ValidationResult with compatibility score and issues
         """
@@ -93,6 +139,7 @@ class DTDLValidatorService:
 
         interface_name = interface.get("displayName", "Unknown")
         issues = []
+        error_count = 0  # Running count of ERROR-severity issues
         matched_telemetry = []
         matched_properties = []
         missing_telemetry = []
@@ -101,20 +148,21 @@ class DTDLValidatorService:
 
         # Extract DTDL contents
         contents = interface.get("contents", [])
-        dtdl_telemetry = {
-            c["name"]: c for c in contents if c.get("@type") == "Telemetry"
-        }
-        dtdl_properties = {
-            c["name"]: c for c in contents if c.get("@type") == "Property"
-        }
+        dtdl_telemetry = {}
+        dtdl_properties = {}
+        for c in contents:
+            if (content_type := c.get("@type")) == "Telemetry":
+                dtdl_telemetry[c["name"]] = c
+            elif content_type == "Property":
+                dtdl_properties[c["name"]] = c
 
         # Extract Thing data
-        thing_telemetry = thing_data.get("telemetry", {})
-        thing_properties = thing_data.get("properties", {})
+        thing_telemetry = values.get("telemetry", {})
+        thing_properties = values.get("properties", {})
 
         # Validate telemetry
         for tel_name, tel_def in dtdl_telemetry.items():
-            if tel_name in thing_telemetry:
+            if tel_name in telemetry_keys:
                 # Check type compatibility
                 schema_issues = self._validate_schema(
                     tel_name,
@@ -124,6 +172,7 @@ class DTDLValidatorService:
                 )
                 if schema_issues:
                     issues.extend(schema_issues)
+                    error_count += self._count_errors(schema_issues)
                 else:
                     matched_telemetry.append(tel_name)
             else:
@@ -132,12 +181,14 @@ class DTDLValidatorService:
                     severity=ValidationSeverity.WARNING,
                     field=f"telemetry.{tel_name}",
                     message=f"Missing telemetry: {tel_name}",
-                    suggestion=f"Add telemetry field '{tel_name}' with schema {tel_def.get('schema')}"
+                    suggestion=partial(
+                        "Add telemetry field '{}' with schema {}".format, tel_name, tel_def.get("schema")
+                    )
                 ))
 
         # Validate properties
         for prop_name, prop_def in dtdl_properties.items():
-            if prop_name in thing_properties:
+            if prop_name in property_keys:
                 # Check type compatibility
                 schema_issues = self._validate_schema(
                     prop_name,
@@ -147,26 +198,37 @@ class DTDLValidatorService:
                 )
                 if schema_issues:
                     issues.extend(schema_issues)
+                    error_count += self._count_errors(schema_issues)
                 else:
                     matched_properties.append(prop_name)
             else:
                 # Check if property is writable (required)
                 is_writable = prop_def.get("writable", False)
                 severity = ValidationSeverity.ERROR if is_writable else ValidationSeverity.WARNING
+                if is_writable:
+                    error_count += 1
 
                 missing_properties.append(prop_name)
                 issues.append(ValidationIssue(
                     severity=severity,
                     field=f"property.{prop_name}",
                     message=f"Missing property: {prop_name}",
-                    suggestion=f"Add property field '{prop_name}' with schema {prop_def.get('schema')}"
+                    suggestion=partial(
+                        "Add property field '{}' with schema {}".format, prop_name, prop_def.get("schema")
+                    )
                 ))
 
-        # Check for extra fields
-        for tel_name in thing_telemetry.keys():
-            if tel_name not in dtdl_telemetry:
+        # Check for extra fields (walk the Thing's dicts only when the set
+        # difference is non-empty, to report them in input order)
+        extra_telemetry = telemetry_keys - dtdl_telemetry.keys()
+        extra_properties = property_keys - dtdl_properties.keys()
+
+        for tel_name in (thing_telemetry if extra_telemetry else ()):
+            if tel_name in extra_telemetry:
                 extra_fields.append(f"telemetry.{tel_name}")
                 severity = ValidationSeverity.ERROR if strict else ValidationSeverity.INFO
+                if strict:
+                    error_count += 1
                 issues.append(ValidationIssue(
                     severity=severity,
                     field=f"telemetry.{tel_name}",
@@ -174,10 +236,12 @@ class DTDLValidatorService:
                     suggestion="Remove this field or extend the interface to include it"
                 ))
 
-        for prop_name in thing_properties.keys():
-            if prop_name not in dtdl_properties:
+        for prop_name in (thing_properties if extra_properties else ()):
+            if prop_name in extra_properties:
                 extra_fields.append(f"property.{prop_name}")
                 severity = ValidationSeverity.ERROR if strict else ValidationSeverity.INFO
+                if strict:
+                    error_count += 1
                 issues.append(ValidationIssue(
                     severity=severity,
                     field=f"property.{prop_name}",
@@ -192,13 +256,11 @@ class DTDLValidatorService:
             missing_telemetry=len(missing_telemetry),
             missing_properties=len(missing_properties),
             extra_fields=len(extra_fields),
-            total_errors=len([i for i in issues if i.severity == ValidationSeverity.ERROR])
+            total_errors=error_count
         )
 
         # Determine compatibility
-        is_compatible = score >= 60 and not any(
-            i.severity == ValidationSeverity.ERROR for i in issues
-        )
+        is_compatible = score >= 60 and error_count == 0
 
         return ValidationResult(
             is_compatible=is_compatible,
@@ -241,12 +303,14 @@ class DTDLValidatorService:
         # Handle simple schema types
         if isinstance(schema, str):
             expected_type = self._map_dtdl_type_to_python(schema)
+            if not expected_type:
+                return issues
             actual_type = type(value).__name__
 
             # Allow int where float is expected (JSON numbers)
             if expected_type == "float" and actual_type == "int":
                 pass
-            elif expected_type and actual_type != expected_type:
+            elif actual_type != expected_type:
                 issues.append(ValidationIssue(
                     severity=ValidationSeverity.WARNING,
                     field=f"{field_type}.{field_name}",
@@ -266,7 +330,7 @@ class DTDLValidatorService:
                         severity=ValidationSeverity.WARNING,
                         field=f"{field_type}.{field_name}",
                         message=f"Invalid enum value: {value}",
-                        suggestion=f"Use one of: {', '.join(str(ev) for ev in enum_values)}"
+                        suggestion=lambda: f"Use one of: {', '.join(str(ev) for ev in enum_values)}"
                     ))
 
             elif schema_type == "Object":
@@ -281,6 +345,11 @@ class DTDLValidatorService:
 
         return issues
 
+    @staticmethod
+    def _count_errors(issues: List[ValidationIssue]) -> int:
+        """Count ERROR-severity issues in a (short) list of issues"""
+        return sum(1 for i in issues if i.severity == ValidationSeverity.ERROR)
+
     def _map_dtdl_type_to_python(self, dtdl_type: str) -> Optional[str]:
         """Map DTDL primitive types to Python types"""
         type_mapping = {
@@ -315,12 +384,21 @@ class DTDLValidatorService:
         - Extra fields incur a small penalty (-2 each)
         - Errors incur a larger penalty (-10 each)
         """
-        total_required = matched_telemetry + matched_properties + missing_telemetry + missing_properties
+        # Fast path: perfect match (the common case) needs no arithmetic
+        if not (missing_telemetry or missing_properties or extra_fields or total_errors):
+            return 100.0
+
+        matched = matched_telemetry + matched_properties
+        total_required = matched + missing_telemetry + missing_properties
+
+        # Nothing matched: penalties can only push the score further below zero
+        if matched == 0 and total_required > 0:
+            return 0.0
 
         if total_required == 0:
             score = 100.0
         else:
-            matched_ratio = (matched_telemetry + matched_properties) / total_required
+            matched_ratio = matched / total_required
             score = matched_ratio * 100.0
 
         score -= extra_fields * 2
@@ -348,6 +426,33 @@ class DTDLValidatorService:
         Returns:
             List of (ValidationResult, combined_score) tuples, sorted by score
         """
+        return self.find_best_matching_interfaces_batch(
+            [thing_data], thing_type=thing_type, domain=domain, top_n=top_n
+        )[0]
+
+    def find_best_matching_interfaces_batch(
+        self,
+        things: List[Dict[str, Any]],
+        thing_type: Optional[str] = None,
+        domain: Optional[str] = None,
+        top_n: int = 5
+    ) -> List[List[Tuple[ValidationResult, float]]]:
+        """
+        Find best matching DTDL interfaces for several Things sharing the same filters
+
+        The candidate search and the per-candidate metadata score are computed
+        once for the whole batch rather than once per Thing.
+
+        Args:
+            things: Twin Thing data for each Thing
+            thing_type: Optional thing type filter
+            domain: Optional domain filter
+            top_n: Number of top results to return per Thing
+
+        Returns:
+            One list of (ValidationResult, combined_score) tuples per Thing, in
+            input order, each sorted by score
+        """
         # Search for candidate interfaces
         candidates = self.loader.search_interfaces(
             thing_type=thing_type,
@@ -356,29 +461,45 @@ class DTDLValidatorService:
 
         if not candidates:
             logger.warning(f"No candidate interfaces found for thing_type={thing_type}, domain={domain}")
-            return []
+            return [[] for _ in things]
 
-        # Validate against each candidate
-        results = []
+        # Metadata match depends only on the candidate and the filters
+        scored_candidates = []
         for candidate in candidates:
             dtmi = candidate["dtmi"]
-            validation = self.validate_thing_against_interface(thing_data, dtmi, strict=False)
-
-            # Calculate combined score (validation + metadata match)
             metadata_score = 0
             if thing_type and candidate.get("thingType") == thing_type:
                 metadata_score += 10
             if domain:
                 if self.loader._is_in_domain_mapping(dtmi, domain):
                     metadata_score += 10
+            scored_candidates.append((dtmi, metadata_score * 0.2))
+
+        batch_results = []
+        for thing_data in things:
+            # Key sets are built once per Thing and reused for every candidate
+            thing_telemetry = thing_data.get("telemetry", {})
+            thing_properties = thing_data.get("properties", {})
+            telemetry_keys = frozenset(thing_telemetry)
+            property_keys = frozenset(thing_properties)
+            values = {"telemetry": thing_telemetry, "properties": thing_properties}
+
+            # Validate against each candidate
+            results = []
+            for dtmi, metadata_part in scored_candidates:
+                validation = self.validate_with_key_sets(
+                    dtmi, telemetry_keys, property_keys, values, strict=False
+                )
 
-            combined_score = (validation.compatibility_score * 0.8) + (metadata_score * 0.2)
-            results.append((validation, combined_score))
+                # Calculate combined score (validation + metadata match)
+                combined_score = (validation.compatibility_score * 0.8) + metadata_part
+                results.append((validation, combined_score))
 
-        # Sort by combined score (descending)
-        results.sort(key=lambda x: x[1], reverse=True)
+            # Sort by combined score (descending)
+            results.sort(key=lambda x: x[1], reverse=True)
+            batch_results.append(results[:top_n])
 
-        return results[:top_n]
+        return batch_results
 
     def get_interface_requirements(self, dtmi: str) -> Dict[str, Any]:
         """
@@ -394,6 +515,12 @@ class DTDLValidatorService:
         if not interface:
             return {}
 
+        # Interface definitions are immutable until the loader reloads, which
+        # replaces the interface objects - so compare identity, not content
+        cached = self._requirements_cache.get(dtmi)
+        if cached is not None and cached[0] is interface:
+            return cached[1]
+
         contents = interface.get("contents", [])
 
         required_telemetry = []
@@ -402,22 +529,25 @@ class DTDLValidatorService:
         optional_properties = []
 
         for content in contents:
-            content_type = content.get("@type")
-            name = content.get("name")
+            get = content.get
+            content_type = get("@type")
+            if content_type != "Telemetry" and content_type != "Property":
+                continue
+            name = get("name")
 
             if content_type == "Telemetry":
                 required_telemetry.append({
                     "name": name,
-                    "displayName": content.get("displayName", name),
-                    "schema": content.get("schema"),
-                    "unit": content.get("unit")
+                    "displayName": get("displayName", name),
+                    "schema": get("schema"),
+                    "unit": get("unit")
                 })
-            elif content_type == "Property":
-                is_writable = content.get("writable", False)
+            else:
+                is_writable = get("writable", False)
                 prop_info = {
                     "name": name,
-                    "displayName": content.get("displayName", name),
-                    "schema": content.get("schema"),
+                    "displayName": get("displayName", name),
+                    "schema": get("schema"),
                     "writable": is_writable
                 }
                 if is_writable:
@@ -425,7 +555,7 @@ class DTDLValidatorService:
                 else:
                     optional_properties.append(prop_info)
 
-        return {
+        requirements = {
             "dtmi": dtmi,
             "displayName": interface.get("displayName"),
             "description": interface.get("description"),
@@ -435,6 +565,9 @@ class DTDLValidatorService:
             "optional_properties": optional_properties,
             "total_requirements": len(required_telemetry) + len(required_properties)
         }
+        self._requirements_cache[dtmi] = (interface, requirements)
+
+        return requirements
 
 
 # Singleton instance
@@ -5,6 +5,7 @@ Simplified tenant management without user authentication or Ditto integration.
 """
 
 from typing import List, Optional
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
@@ -21,17 +22,6 @@ class TenantManager:
     def create_tenant(self, tenant_data: TenantCreate) -> Tenant:
         """Create a new tenant"""
         
-        # Check if tenant ID already exists
-        existing_tenant = self.db.query(Tenant).filter(
-            Tenant.tenant_id == tenant_data.tenant_id
-        ).first()
-        
-        if existing_tenant:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Tenant with ID '{tenant_data.tenant_id}' already exists"
-            )
-        
         # Create tenant record
         db_tenant = Tenant(
             tenant_id=tenant_data.tenant_id,
@@ -41,12 +31,62 @@ class TenantManager:
             max_things=tenant_data.max_things
         )
         
+        # Rely on the UNIQUE constraint on tenant_id instead of a SELECT before INSERT
         self.db.add(db_tenant)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Tenant with ID '{tenant_data.tenant_id}' already exists"
+            )
         self.db.refresh(db_tenant)
         
         return db_tenant
     
+    def create_tenants(self, tenants_data: List[TenantCreate]) -> List[Tenant]:
+        """
+        Create several tenants in one transaction, skipping IDs that already exist
+
+        Existing IDs are found with a single IN query and all new rows are
+        committed together.
+
+        Returns:
+            The tenants that were created
+        """
+        requested_ids = [t.tenant_id for t in tenants_data]
+        existing_ids = {
+            tenant_id for (tenant_id,) in
+            self.db.query(Tenant.tenant_id).filter(Tenant.tenant_id.in_(requested_ids))
+        }
+
+        new_tenants = []
+        for tenant_data in tenants_data:
+            if tenant_data.tenant_id in existing_ids:
+                continue
+            existing_ids.add(tenant_data.tenant_id)
+            new_tenants.append(Tenant(
+                tenant_id=tenant_data.tenant_id,
+                name=tenant_data.name,
+                description=tenant_data.description,
+                is_active=tenant_data.is_active,
+                max_things=tenant_data.max_things
+            ))
+
+        if new_tenants:
+            self.db.add_all(new_tenants)
+            try:
+                self.db.commit()
+            except IntegrityError:
+                self.db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="One or more tenants already exist"
+                )
+
+        return new_tenants
+    
     def get_tenant_by_id(self, tenant_id: str, active_only: bool = False) -> Optional[Tenant]:
         """Get tenant by tenant_id"""
         query = self.db.query(Tenant).filter(Tenant.tenant_id == tenant_id)
@@ -9,28 +9,104 @@ Usage:
     interface_yaml = generator.generate_twin_interface_yaml(thing_description_dict)
     instance_yaml = generator.generate_twin_instance_yaml(thing_description_dict, interface_name)
 """
+import json
+import os
 import re
 import yaml
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import IO, Dict, List, Optional, Any, Tuple
+from datetime import datetime, timezone
+from pydantic import TypeAdapter
+
+# Prefer the libyaml-backed dumper/loader; fall back to the pure-Python ones
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
+# Prefer orjson for JSON-formatted input documents; fall back to the stdlib
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string for generated-at labels"""
+    return datetime.now(timezone.utc).isoformat()
+
+
+# Batches smaller than this are not worth the process pool start-up cost
+_PARALLEL_MIN_BATCH = 64
+
+# Patterns used by TwinGeneratorService._normalize_name
+_INVALID_NAME_CHARS_RE = re.compile(r"[^a-z0-9-]")
+_DASH_RUN_RE = re.compile(r"-+")
+
+# Constant spec sections shared by every generated TwinInterface. They are only
+# read (by the YAML dumper); each must stay a distinct object, since a dict
+# referenced twice within one document would be dumped as a YAML anchor/alias.
+_DEFAULT_SERVICE_SPEC = {
+    "image": "iodt2/twin-service:latest",
+    "resources": {
+        "cpu": "500m",
+        "memory": "512Mi",
+    },
+    "autoscaling": {
+        "min": 1,
+        "max": 10,
+    },
+}
+_DEFAULT_EVENT_STORE = {"persistRealEvent": True}
+_DEFAULT_HISTORICAL_STORE = {"persistRealEvent": True}
+
+# WoT link relations that describe the Thing itself rather than a relationship
+_IGNORED_LINK_RELS = frozenset({"self", "type"})
+
+# WoT data type -> Twin property type
+_WOT_TYPE_MAPPING = {
+    "number": "float",
+    "integer": "integer",
+    "string": "string",
+    "boolean": "boolean",
+    "object": "object",
+    "array": "array",
+}
+
+# Coerces x-writable exactly as the TwinProperty model field (Optional[bool]) does,
+# e.g. "yes"/"on"/1 -> True; anything else non-boolean raises a ValidationError
+_WRITABLE_ADAPTER = TypeAdapter(Optional[bool])
+
+
+
+@lru_cache(maxsize=4096)
+def _normalize_twin_name(thing_id: str, prefix: str) -> str:
+    """Cached body of TwinGeneratorService._normalize_name"""
+    # Remove URN prefix if present
+    name = thing_id.rsplit(":", 1)[-1]
+
+    # Convert to lowercase and replace invalid chars
+    name = _INVALID_NAME_CHARS_RE.sub("-", name.lower())
+
+    # Remove consecutive dashes
+    name = _DASH_RUN_RE.sub("-", name).strip("-")
+
+    # Add prefix
+    return f"{prefix}-{name}"
+
+
+@lru_cache(maxsize=4096)
+def _href_target_name(href: str, prefix: str) -> str:
+    """Normalized name of the last path/URN segment of a link href"""
+    # Example: urn:iodt2:interface:location -> iodt2-location
+    return _normalize_twin_name(href.rsplit("/", 1)[-1], prefix)
 
 try:
     # Relative import (when used as part of app)
     from ..models import (
         TwinInterfaceCR,
         TwinInstanceCR,
-        TwinMetadata,
-        TwinInterfaceSpec,
-        TwinInstanceSpec,
-        TwinProperty,
-        TwinRelationship,
-        TwinCommand,
-        ServiceSpec,
-        ServiceResources,
-        ServiceAutoscaling,
-        EventStoreSpec,
-        HistoricalStoreSpec,
-        TwinInstanceRelationship,
         ValidationResult,
     )
 except ImportError:
@@ -38,18 +114,6 @@ except ImportError:
     from app.models.twin_models import (
         TwinInterfaceCR,
         TwinInstanceCR,
-        TwinMetadata,
-        TwinInterfaceSpec,
-        TwinInstanceSpec,
-        TwinProperty,
-        TwinRelationship,
-        TwinCommand,
-        ServiceSpec,
-        ServiceResources,
-        ServiceAutoscaling,
-        EventStoreSpec,
-        HistoricalStoreSpec,
-        TwinInstanceRelationship,
         ValidationResult,
     )
 
@@ -73,8 +137,10 @@ class TwinGeneratorService:
         include_service_spec: bool = True,
         thing_type: str = "device",
         domain_metadata: Optional[Dict[str, str]] = None,
-        dtdl_interface: Optional[Dict[str, Any]] = None
-    ) -> str:
+        dtdl_interface: Optional[Dict[str, Any]] = None,
+        generated_at: Optional[str] = None,
+        stream: Optional[IO[str]] = None
+    ) -> Optional[str]:
         """
         Generate TwinInterface YAML from WoT Thing Description
 
@@ -84,9 +150,11 @@ class TwinGeneratorService:
             thing_type: Thing modeling type ('device', 'sensor', 'component')
             domain_metadata: Domain metadata (manufacturer, model, serial_number, firmware_version)
             dtdl_interface: Optional DTDL interface metadata (dtmi, displayName, etc.)
+            generated_at: Timestamp for the generated-at label (defaults to now, UTC)
+            stream: Optional text stream to write the YAML to instead of returning it
 
         Returns:
-            YAML string representing TwinInterface
+            YAML string representing TwinInterface (None when written to stream)
 
         Raises:
             ValueError: If thing_description is invalid
@@ -101,7 +169,7 @@ class TwinGeneratorService:
         # Build labels
         labels = {
             "generated-by": "iodt2-platform",
-            "generated-at": datetime.utcnow().isoformat(),
+            "generated-at": generated_at or _utc_now_iso(),
             "thing-type": thing_type,  # NEW: Add thing type
         }
 
@@ -140,40 +208,37 @@ class TwinGeneratorService:
                 annotations["dtdl-category"] = dtdl_interface["category"]
 
         # Build TwinInterface CR
-        interface_cr = TwinInterfaceCR(
-            metadata=TwinMetadata(
-                name=interface_name,
-                labels=labels,
-                annotations=annotations,
-            ),
-            spec=TwinInterfaceSpec(
-                name=interface_name,
-                properties=self._extract_properties(thing_description),
-                relationships=self._extract_relationships(thing_description),
-                commands=self._extract_commands(thing_description),
-                service=self._build_service_spec() if include_service_spec else None,
-                eventStore=EventStoreSpec(persistRealEvent=True),
-                historicalStore=HistoricalStoreSpec(persistRealEvent=True),
-            )
+        interface_cr = self._build_interface_dict(
+            name=interface_name,
+            labels=labels,
+            annotations=annotations,
+            properties=self._extract_properties(thing_description),
+            relationships=self._extract_relationships(thing_description),
+            commands=self._extract_commands(thing_description),
+            service=self._build_service_spec() if include_service_spec else None,
         )
 
         # Convert to YAML
-        return self._to_yaml(interface_cr.model_dump(by_alias=True, exclude_none=True))
+        return self._to_yaml(interface_cr, stream)
 
     def generate_twin_instance_yaml(
         self,
         thing_description: Dict[str, Any],
-        interface_name: Optional[str] = None
-    ) -> str:
+        interface_name: Optional[str] = None,
+        generated_at: Optional[str] = None,
+        stream: Optional[IO[str]] = None
+    ) -> Optional[str]:
         """
         Generate TwinInstance YAML from WoT Thing Description
 
         Args:
             thing_description: W3C WoT Thing Description dict
             interface_name: Name of the TwinInterface (auto-generated if not provided)
+            generated_at: Timestamp for the generated-at label (defaults to now, UTC)
+            stream: Optional text stream to write the YAML to instead of returning it
 
         Returns:
-            YAML string representing TwinInstance
+            YAML string representing TwinInstance (None when written to stream)
 
         Raises:
             ValueError: If thing_description is invalid
@@ -188,27 +253,110 @@ class TwinGeneratorService:
             interface_name = instance_name
 
         # Build TwinInstance CR
-        instance_cr = TwinInstanceCR(
-            metadata=TwinMetadata(
-                name=instance_name,
-                labels={
-                    "generated-by": "iodt2-platform",
-                    "generated-at": datetime.utcnow().isoformat(),
-                },
-                annotations={
-                    "source": "wot-thing-description",
-                    "original-id": thing_id,
-                }
-            ),
-            spec=TwinInstanceSpec(
-                name=instance_name,
-                interface=interface_name,
-                twinInstanceRelationships=self._extract_instance_relationships(thing_description),
-            )
+        instance_cr = self._build_instance_dict(
+            name=instance_name,
+            interface=interface_name,
+            labels={
+                "generated-by": "iodt2-platform",
+                "generated-at": generated_at or _utc_now_iso(),
+            },
+            annotations={
+                "source": "wot-thing-description",
+                "original-id": thing_id,
+            },
+            relationships=self._extract_instance_relationships(thing_description),
         )
 
         # Convert to YAML
-        return self._to_yaml(instance_cr.model_dump(by_alias=True, exclude_none=True))
+        return self._to_yaml(instance_cr, stream)
+
+    def generate_many(
+        self,
+        thing_descriptions: List[Dict[str, Any]],
+        include_service_spec: bool = True,
+        generated_at: Optional[str] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Generate TwinInterface and TwinInstance YAML for a batch of Thing Descriptions
+
+        All documents in the batch share one generated-at timestamp.
+
+        Args:
+            thing_descriptions: W3C WoT Thing Description dicts
+            include_service_spec: Whether to include service/container spec
+            generated_at: Timestamp for the generated-at labels (defaults to now, UTC)
+
+        Returns:
+            List of (interface_yaml, instance_yaml) tuples, in input order
+
+        Raises:
+            ValueError: If any thing_description is invalid
+        """
+        generated_at = generated_at or _utc_now_iso()
+
+        results = []
+        for thing_description in thing_descriptions:
+            interface_yaml = self.generate_twin_interface_yaml(
+                thing_description,
+                include_service_spec=include_service_spec,
+                generated_at=generated_at,
+            )
+            instance_yaml = self.generate_twin_instance_yaml(
+                thing_description, generated_at=generated_at
+            )
+            results.append((interface_yaml, instance_yaml))
+
+        return results
+
+    def generate_many_parallel(
+        self,
+        thing_descriptions: List[Dict[str, Any]],
+        include_service_spec: bool = True,
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Like generate_many, but spreads a large batch over worker processes
+
+        Generation is CPU-bound (YAML emission, name normalization), so large
+        bulk imports scale with cores instead of being capped by the GIL.
+        Batches below _PARALLEL_MIN_BATCH run in-process.
+
+        Args:
+            thing_descriptions: W3C WoT Thing Description dicts
+            include_service_spec: Whether to include service/container spec
+            max_workers: Worker process count (defaults to the CPU count)
+
+        Returns:
+            List of (interface_yaml, instance_yaml) tuples, in input order
+
+        Raises:
+            ValueError: If any thing_description is invalid
+        """
+        generated_at = _utc_now_iso()
+        workers = max_workers or os.cpu_count() or 1
+
+        if workers < 2 or len(thing_descriptions) < _PARALLEL_MIN_BATCH:
+            return self.generate_many(thing_descriptions, include_service_spec, generated_at)
+
+        # A few chunks per worker keeps the pool busy without per-item pickling
+        chunk_size = -(-len(thing_descriptions) // (workers * 4))
+        chunks = [
+            thing_descriptions[i:i + chunk_size]
+            for i in range(0, len(thing_descriptions), chunk_size)
+        ]
+
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_results in executor.map(
+                _generate_chunk,
+                [type(self)] * len(chunks),
+                chunks,
+                [include_service_spec] * len(chunks),
+                [generated_at] * len(chunks),
+            ):
+                results.extend(chunk_results)
+
+        return results
 
     def generate_location_instance_yaml(
         self,
@@ -228,22 +376,18 @@ class TwinGeneratorService:
 
         location_name = self._normalize_name(location_data["name"])
 
-        location_cr = TwinInstanceCR(
-            metadata=TwinMetadata(
-                name=f"{location_name}-location",
-                labels={
-                    "type": "location",
-                    "generated-by": "iodt2-platform",
-                },
-            ),
-            spec=TwinInstanceSpec(
-                name=f"{location_name}-location",
-                interface="iodt2-location",
-                twinInstanceRelationships=[],
-            )
+        location_cr = self._build_instance_dict(
+            name=f"{location_name}-location",
+            interface="iodt2-location",
+            labels={
+                "type": "location",
+                "generated-by": "iodt2-platform",
+            },
+            annotations={},
+            relationships=[],
         )
 
-        return self._to_yaml(location_cr.model_dump(by_alias=True, exclude_none=True))
+        return self._to_yaml(location_cr)
 
     def validate_twin_yaml(
         self,
@@ -257,6 +401,32 @@ class TwinGeneratorService:
             yaml_content: YAML string to validate
             kind: Expected kind (TwinInterface or TwinInstance)
 
+        Returns:
+            ValidationResult with valid flag and errors/warnings
+        """
+        try:
+            # Parse YAML
+            data = _load_yaml(yaml_content)
+        except yaml.YAMLError as e:
+            return ValidationResult(valid=False, errors=[f"YAML parsing error: {str(e)}"])
+
+        return self.validate_twin_dict(data, kind)
+
+    def validate_twin_dict(
+        self,
+        data: Any,
+        kind: str
+    ) -> ValidationResult:
+        """
+        Validate an already-parsed Twin CR
+
+        Same checks as validate_twin_yaml, for callers that hold the dict and
+        should not pay for a YAML round-trip.
+
+        Args:
+            data: Parsed CR document
+            kind: Expected kind (TwinInterface or TwinInstance)
+
         Returns:
             ValidationResult with valid flag and errors/warnings
         """
@@ -264,9 +434,6 @@ class TwinGeneratorService:
         warnings = []
 
         try:
-            # Parse YAML
-            data = yaml.safe_load(yaml_content)
-
             # Check structure
             if not isinstance(data, dict):
                 errors.append("YAML must be a dictionary")
@@ -295,8 +462,6 @@ class TwinGeneratorService:
             else:
                 errors.append(f"Unknown kind: {kind}")
 
-        except yaml.YAMLError as e:
-            errors.append(f"YAML parsing error: {str(e)}")
         except Exception as e:
             errors.append(f"Validation error: {str(e)}")
 
@@ -318,40 +483,97 @@ class TwinGeneratorService:
             urn:iodt2:sensor:temp-001 -> iodt2-temp-001
             sensor-temp-001 -> iodt2-sensor-temp-001
         """
-        # Remove URN prefix if present
-        name = thing_id.split(":")[-1]
+        return _normalize_twin_name(thing_id, self.NAMESPACE_PREFIX)
 
-        # Convert to lowercase and replace invalid chars
-        name = re.sub(r"[^a-z0-9-]", "-", name.lower())
+    def _build_interface_dict(
+        self,
+        name: str,
+        labels: Dict[str, str],
+        annotations: Dict[str, str],
+        properties: List[Dict[str, Any]],
+        relationships: List[Dict[str, Any]],
+        commands: List[Dict[str, Any]],
+        service: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Build a TwinInterface CR as a plain dict
 
-        # Remove consecutive dashes
-        name = re.sub(r"-+", "-", name).strip("-")
+        Produces the same shape as TwinInterfaceCR.model_dump(by_alias=True,
+        exclude_none=True) without constructing the Pydantic models; the
+        models are still used to validate YAML coming back in.
+        """
+        spec = {
+            "name": name,
+            "properties": properties,
+            "relationships": relationships,
+            "commands": commands,
+        }
+        if service is not None:
+            spec["service"] = service
+        spec["eventStore"] = _DEFAULT_EVENT_STORE
+        spec["historicalStore"] = _DEFAULT_HISTORICAL_STORE
+
+        return {
+            "apiVersion": "dtd.twin/v0",
+            "kind": "TwinInterface",
+            "metadata": {"name": name, "labels": labels, "annotations": annotations},
+            "spec": spec,
+        }
 
-        # Add prefix
-        return f"{self.NAMESPACE_PREFIX}-{name}"
+    def _build_instance_dict(
+        self,
+        name: str,
+        interface: str,
+        labels: Dict[str, str],
+        annotations: Dict[str, str],
+        relationships: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build a TwinInstance CR as a plain dict (see _build_interface_dict)"""
+        return {
+            "apiVersion": "dtd.twin/v0",
+            "kind": "TwinInstance",
+            "metadata": {"name": name, "labels": labels, "annotations": annotations},
+            "spec": {
+                "name": name,
+                "interface": interface,
+                "twinInstanceRelationships": relationships,
+            },
+        }
 
     def _extract_properties(
         self,
         thing_description: Dict[str, Any]
-    ) -> List[TwinProperty]:
+    ) -> List[Dict[str, Any]]:
         """Extract properties from WoT Thing Description"""
         properties = []
         wot_properties = thing_description.get("properties", {})
 
+        type_mapping = _WOT_TYPE_MAPPING
+
         for prop_name, prop_def in wot_properties.items():
+            get = prop_def.get
+
             # Map WoT type to Twin type
-            wot_type = prop_def.get("type", "string")
-            twin_type = self._map_wot_type_to_twin(wot_type)
-
-            property_obj = TwinProperty(
-                name=prop_name,
-                type=twin_type,
-                description=prop_def.get("description") or prop_def.get("title"),
-                x_writable=prop_def.get("writable", False),
-                x_minimum=prop_def.get("minimum"),
-                x_maximum=prop_def.get("maximum"),
-                x_unit=prop_def.get("unit"),
-            )
+            twin_type = type_mapping.get(get("type", "string").lower(), "string")
+
+            property_obj = {"name": prop_name, "type": twin_type}
+            description = get("description") or get("title")
+            if description is not None:
+                property_obj["description"] = description
+            writable = get("writable", False)
+            if type(writable) is not bool:
+                writable = _WRITABLE_ADAPTER.validate_python(writable)
+            if writable is not None:
+                property_obj["x-writable"] = writable
+            minimum = get("minimum")
+            if minimum is not None:
+                property_obj["x-minimum"] = float(minimum)
+            maximum = get("maximum")
+            if maximum is not None:
+                property_obj["x-maximum"] = float(maximum)
+            unit = get("unit")
+            if unit is not None:
+                property_obj["x-unit"] = unit
             properties.append(property_obj)
 
         return properties
@@ -359,14 +581,14 @@ class TwinGeneratorService:
     def _extract_relationships(
         self,
         thing_description: Dict[str, Any]
-    ) -> List[TwinRelationship]:
+    ) -> List[Dict[str, Any]]:
         """Extract relationships from WoT Thing Description links"""
         relationships = []
         links = thing_description.get("links", [])
 
         for link in links:
             rel = link.get("rel")
-            if not rel or rel in ["self", "type"]:
+            if not rel or rel in _IGNORED_LINK_RELS:
                 continue
 
             # Extract target interface from href
@@ -374,11 +596,10 @@ class TwinGeneratorService:
             target_interface = self._extract_interface_from_href(href)
 
             if target_interface:
-                relationship = TwinRelationship(
-                    name=rel,
-                    interface=target_interface,
-                    description=link.get("title"),
-                )
+                relationship = {"name": rel, "interface": target_interface}
+                title = link.get("title")
+                if title is not None:
+                    relationship["description"] = title
                 relationships.append(relationship)
 
         return relationships
@@ -386,17 +607,19 @@ class TwinGeneratorService:
     def _extract_commands(
         self,
         thing_description: Dict[str, Any]
-    ) -> List[TwinCommand]:
+    ) -> List[Dict[str, Any]]:
         """Extract commands/actions from WoT Thing Description"""
         commands = []
         wot_actions = thing_description.get("actions", {})
 
         for action_name, action_def in wot_actions.items():
-            command = TwinCommand(
-                name=action_name,
-                description=action_def.get("description") or action_def.get("title"),
-                schema=action_def.get("input", {}),
-            )
+            command = {"name": action_name}
+            description = action_def.get("description") or action_def.get("title")
+            if description is not None:
+                command["description"] = description
+            schema = action_def.get("input", {})
+            if schema is not None:
+                command["schema"] = schema
             commands.append(command)
 
         return commands
@@ -404,14 +627,14 @@ class TwinGeneratorService:
     def _extract_instance_relationships(
         self,
         thing_description: Dict[str, Any]
-    ) -> List[TwinInstanceRelationship]:
+    ) -> List[Dict[str, Any]]:
         """Extract concrete instance relationships from WoT links"""
         relationships = []
         links = thing_description.get("links", [])
 
         for link in links:
             rel = link.get("rel")
-            if not rel or rel in ["self", "type"]:
+            if not rel or rel in _IGNORED_LINK_RELS:
                 continue
 
             href = link.get("href", "")
@@ -419,78 +642,56 @@ class TwinGeneratorService:
             target_instance = self._extract_instance_from_href(href)
 
             if target_interface and target_instance:
-                relationship = TwinInstanceRelationship(
-                    name=rel,
-                    interface=target_interface,
-                    instance=target_instance,
-                )
-                relationships.append(relationship)
+                relationships.append({
+                    "name": rel,
+                    "interface": target_interface,
+                    "instance": target_instance,
+                })
 
         return relationships
 
-    def _build_service_spec(self) -> ServiceSpec:
-        """Build default service specification"""
-        return ServiceSpec(
-            image="iodt2/twin-service:latest",
-            resources=ServiceResources(
-                cpu="500m",
-                memory="512Mi"
-            ),
-            autoscaling=ServiceAutoscaling(
-                min=1,
-                max=10
-            )
-        )
+    def _build_service_spec(self) -> Dict[str, Any]:
+        """Return the default service specification (shared, read-only)"""
+        return _DEFAULT_SERVICE_SPEC
 
     def _map_wot_type_to_twin(self, wot_type: str) -> str:
         """Map WoT data type to Twin type"""
-        type_mapping = {
-            "number": "float",
-            "integer": "integer",
-            "string": "string",
-            "boolean": "boolean",
-            "object": "object",
-            "array": "array",
-        }
-        return type_mapping.get(wot_type.lower(), "string")
+        return _WOT_TYPE_MAPPING.get(wot_type.lower(), "string")
 
     def _extract_interface_from_href(self, href: str) -> Optional[str]:
         """Extract interface name from link href"""
         if not href:
             return None
 
-        # Try to extract interface name from URN or path
-        # Example: urn:iodt2:interface:location -> iodt2-location
-        parts = href.split("/")[-1].split(":")
-        if parts:
-            return self._normalize_name(parts[-1])
-
-        return None
+        return _href_target_name(href, self.NAMESPACE_PREFIX)
 
     def _extract_instance_from_href(self, href: str) -> Optional[str]:
         """Extract instance name from link href"""
         if not href:
             return None
 
-        # Similar to interface extraction
-        parts = href.split("/")[-1].split(":")
-        if parts:
-            return self._normalize_name(parts[-1])
-
-        return None
+        return _href_target_name(href, self.NAMESPACE_PREFIX)
 
-    def _to_yaml(self, data: Dict[str, Any]) -> str:
+    def _to_yaml(
+        self,
+        data: Dict[str, Any],
+        stream: Optional[IO[str]] = None
+    ) -> Optional[str]:
         """
         Convert dictionary to YAML string with proper formatting
 
         Args:
             data: Dictionary to convert
+            stream: Optional text stream; when given the YAML is written to it
+                directly instead of being built up as a string
 
         Returns:
-            Formatted YAML string
+            Formatted YAML string, or None when written to stream
         """
         return yaml.dump(
             data,
+            stream,
+            Dumper=_YamlDumper,
             default_flow_style=False,
             sort_keys=False,
             allow_unicode=True,
@@ -498,6 +699,36 @@ class TwinGeneratorService:
         )
 
 
+# ============================================================================
+# YAML Loading
+# ============================================================================
+
+def _load_yaml(content: str) -> Any:
+    """
+    Parse a YAML document, taking the JSON fast path for JSON-formatted input
+
+    Documents produced by JSON tooling are valid YAML but are parsed far
+    faster by a JSON decoder; anything that does not decode as JSON goes
+    through the YAML loader.
+    """
+    if content.lstrip().startswith("{"):
+        try:
+            return _json_loads(content)
+        except ValueError:
+            pass
+    return yaml.load(content, Loader=_YamlLoader)
+
+
+def _generate_chunk(
+    generator_cls: type,
+    thing_descriptions: List[Dict[str, Any]],
+    include_service_spec: bool,
+    generated_at: str
+) -> List[Tuple[str, str]]:
+    """Worker-process entry point for generate_many_parallel"""
+    return generator_cls().generate_many(thing_descriptions, include_service_spec, generated_at)
+
+
 # ============================================================================
 # Convenience Functions
 # ============================================================================
@@ -516,8 +747,7 @@ def generate_twin_yaml_files(
     """
     generator = TwinGeneratorService()
 
-    interface_yaml = generator.generate_twin_interface_yaml(thing_description)
-    instance_yaml = generator.generate_twin_instance_yaml(thing_description)
+    [(interface_yaml, instance_yaml)] = generator.generate_many([thing_description])
 
     return {
         "interface": interface_yaml,
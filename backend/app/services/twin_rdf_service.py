@@ -10,20 +10,30 @@ Usage:
     results = await service.query_interfaces()
 """
 
+import asyncio
+import copy
+import csv
+import gzip
+import io
 import json
 import logging
+import re
+import time
 import yaml
 import aiohttp
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
-from rdflib import Graph, Literal, URIRef, BNode, Namespace
-from rdflib.namespace import RDF, RDFS, XSD
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, Callable, FrozenSet, Iterator, List, Optional, Tuple
+from rdflib import Graph, Literal
+from rdflib.namespace import RDF, XSD
 
 from ..core.config import get_settings
 from ..core import (
     TWIN, TWIN_DATA,
     create_interface_uri, create_instance_uri,
     create_property_uri, create_relationship_uri, create_command_uri,
+    create_instance_relationship_uri,
     get_twin_ontology
 )
 from ..core.exceptions import FusekiException
@@ -31,10 +41,695 @@ from ..core.exceptions import FusekiException
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+    logger.warning("libyaml not available, falling back to pure-Python YAML loader")
+
+# Prefer orjson for decoding SPARQL JSON results and encoding command schemas;
+# fall back to the stdlib
+try:
+    import orjson
+    from orjson import loads as _json_loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+
+def _dumps_schema(schema: Any) -> str:
+    """Serialize a command schema to compact JSON text"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(schema).decode("utf-8")
+        except TypeError:
+            # e.g. non-string keys or integers beyond 64 bits
+            pass
+    return json.dumps(schema, separators=(",", ":"))
+
+# Shared HTTP session for all Fuseki calls (keeps connections alive across requests)
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_fuseki_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session used for Fuseki communication
+
+    Returns:
+        aiohttp.ClientSession instance (created on first use)
+    """
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+        )
+    return _http_session
+
+
+async def close_fuseki_session():
+    """Close the shared Fuseki HTTP session (call on application shutdown)"""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
+
+def _tenant_only_graphs_read(tenant_id: Optional[str]) -> Optional[FrozenSet[str]]:
+    """Tenants whose graphs a _tenant_only_graph_filter query reads (None: every graph)"""
+    return frozenset((tenant_id,)) if tenant_id else None
+
+
+def _tenant_and_default_graphs_read(tenant_id: Optional[str]) -> Optional[FrozenSet[str]]:
+    """Tenants whose graphs a _tenant_graph_filter query reads (None: every graph)"""
+    if not tenant_id or tenant_id == "default":
+        return None
+    return frozenset((tenant_id, "default"))
+
+
+class _TTLCache:
+    """
+    Small LRU cache whose entries expire after a fixed time-to-live
+
+    Keys end with the tenant_id the cached query was filtered on; graphs_read
+    maps that to the tenants whose graphs the query reads, so a write only
+    evicts entries that could have seen it. Values are deep-copied in and out
+    so callers cannot mutate cached results.
+
+    Readers capture generation(key) before querying and pass it to set(); a
+    write to a tenant the query reads bumps the generation, so a result that
+    raced with the write is not cached.
+
+    The cache is per-process: with several workers, a write in one worker does
+    not invalidate the others, which may serve stale results for up to ttl.
+    """
+
+    def __init__(
+        self,
+        graphs_read: Callable[[Optional[str]], Optional[FrozenSet[str]]],
+        maxsize: int = 1024,
+        ttl: float = 60.0
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.graphs_read = graphs_read
+        self._data: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        # Write generations per tenant, plus a total for queries reading every graph
+        self._generations: Dict[Optional[str], int] = {}
+        self._total_generation = 0
+
+    def generation(self, key: Tuple) -> Any:
+        """Snapshot of the write generations of the graphs the key's query reads"""
+        tenants = self.graphs_read(key[-1])
+        if tenants is None:
+            return self._total_generation
+        return tuple(self._generations.get(tenant, 0) for tenant in sorted(tenants))
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: Tuple, value: Any, generation: Any):
+        """Cache value unless a write to its graphs happened since generation was taken"""
+        if generation != self.generation(key):
+            return
+        self._data[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate_tenant(self, tenant_id: Optional[str]):
+        """Drop entries whose query reads the tenant's graphs and start a new generation"""
+        self._generations[tenant_id] = self._generations.get(tenant_id, 0) + 1
+        self._total_generation += 1
+        stale = []
+        for key in self._data:
+            tenants = self.graphs_read(key[-1])
+            if tenants is None or tenant_id in tenants:
+                stale.append(key)
+        for key in stale:
+            del self._data[key]
+
+
+# Read-through caches for interface details, thing lookups and instance relationships,
+# keyed on (id, tenant_id). Module-level because TwinRDFService is instantiated per request.
+# Each cache's graphs_read must match the graph filter its query uses.
+_interface_details_cache = _TTLCache(graphs_read=_tenant_only_graphs_read)
+_thing_cache = _TTLCache(graphs_read=_tenant_and_default_graphs_read)
+_relationships_cache = _TTLCache(graphs_read=_tenant_only_graphs_read)
+
+
+def _invalidate_read_caches(tenant_id: Optional[str]):
+    """Forget cached reads that a write to the tenant's graphs may have changed"""
+    _interface_details_cache.invalidate_tenant(tenant_id)
+    _thing_cache.invalidate_tenant(tenant_id)
+    _relationships_cache.invalidate_tenant(tenant_id)
+
+
+# Bound on concurrent graph uploads across all requests (Fuseki commits one writer at a time,
+# so extra parallel PUTs only queue server-side)
+_FUSEKI_WRITE_CONCURRENCY = 4
+_write_semaphore: Optional[asyncio.Semaphore] = None
+_write_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_write_semaphore() -> asyncio.Semaphore:
+    """Get the upload semaphore for the running event loop (created on first use)"""
+    global _write_semaphore, _write_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _write_semaphore is None or _write_semaphore_loop is not loop:
+        _write_semaphore = asyncio.Semaphore(_FUSEKI_WRITE_CONCURRENCY)
+        _write_semaphore_loop = loop
+    return _write_semaphore
+
+
+def iter_ntriples(graph: Graph, chunk_size: int = 512) -> Iterator[bytes]:
+    """
+    Serialize a graph as N-Triples, yielding encoded chunks for a streamed request body
+
+    Avoids rdflib's Turtle serializer (prefix/grouping pass) and never holds the
+    whole document in memory.
+
+    Args:
+        graph: RDF graph to serialize
+        chunk_size: Number of triples per yielded chunk
+    """
+    # Subjects and predicates repeat across triples; render each term once
+    rendered: Dict[Any, str] = {}
+
+    def n3(term) -> str:
+        text = rendered.get(term)
+        if text is None:
+            text = rendered[term] = term.n3()
+        return text
+
+    lines = []
+    for s, p, o in graph:
+        obj = _nt_term_literal(o) if isinstance(o, Literal) else o.n3()
+        lines.append(f"{n3(s)} {n3(p)} {obj} .\n")
+        if len(lines) >= chunk_size:
+            yield "".join(lines).encode("utf-8")
+            lines.clear()
+    if lines:
+        yield "".join(lines).encode("utf-8")
+
+
+async def aiter_ntriples(graph: Graph, chunk_size: int = 512) -> AsyncIterator[bytes]:
+    """Async variant of iter_ntriples, for aiohttp/httpx streamed request bodies"""
+    for chunk in iter_ntriples(graph, chunk_size):
+        yield chunk
+
+
+# Uploads smaller than this are sent uncompressed even with FUSEKI_GZIP_UPLOADS
+_GZIP_MIN_BYTES = 1024
+
+# Ontology terms pre-rendered in N-Triples form (<uri>), resolved once at import
+# Classes
+TS_COMMAND = TWIN.Command.n3()
+TS_INSTANCE_RELATIONSHIP = TWIN.InstanceRelationship.n3()
+TS_PROPERTY = TWIN.Property.n3()
+TS_RELATIONSHIP = TWIN.Relationship.n3()
+TS_TWIN_INSTANCE = TWIN.TwinInstance.n3()
+TS_TWIN_INTERFACE = TWIN.TwinInterface.n3()
+
+# Predicates
+TS_COMMAND_NAME = TWIN.commandName.n3()
+TS_DESCRIPTION = TWIN.description.n3()
+TS_DTDL_CATEGORY = TWIN.dtdlCategory.n3()
+TS_DTDL_INTERFACE = TWIN.dtdlInterface.n3()
+TS_DTDL_INTERFACE_NAME = TWIN.dtdlInterfaceName.n3()
+TS_FIRMWARE_VERSION = TWIN.firmwareVersion.n3()
+TS_GENERATED_AT = TWIN.generatedAt.n3()
+TS_GENERATED_BY = TWIN.generatedBy.n3()
+TS_HAS_COMMAND = TWIN.hasCommand.n3()
+TS_HAS_INSTANCE_RELATIONSHIP = TWIN.hasInstanceRelationship.n3()
+TS_HAS_PROPERTY = TWIN.hasProperty.n3()
+TS_HAS_RELATIONSHIP = TWIN.hasRelationship.n3()
+TS_INSTANCE_OF = TWIN.instanceOf.n3()
+TS_MANUFACTURER = TWIN.manufacturer.n3()
+TS_MAXIMUM = TWIN.maximum.n3()
+TS_MINIMUM = TWIN.minimum.n3()
+TS_MODEL = TWIN.model.n3()
+TS_NAME = TWIN.name.n3()
+TS_ORIGINAL_ID = TWIN.originalId.n3()
+TS_PROPERTY_NAME = TWIN.propertyName.n3()
+TS_PROPERTY_TYPE = TWIN.propertyType.n3()
+TS_RELATIONSHIP_NAME = TWIN.relationshipName.n3()
+TS_SCHEMA = TWIN.schema.n3()
+TS_SERIAL_NUMBER = TWIN.serialNumber.n3()
+TS_SOURCE_FORMAT = TWIN.sourceFormat.n3()
+TS_TARGET_INSTANCE = TWIN.targetInstance.n3()
+TS_TARGET_INTERFACE = TWIN.targetInterface.n3()
+TS_THING_TYPE = TWIN.thingType.n3()
+TS_UNIT = TWIN.unit.n3()
+TS_WRITABLE = TWIN.writable.n3()
+
+# Standard vocabulary
+RDF_TYPE = RDF.type.n3()
+XSD_BOOLEAN = XSD.boolean.n3()
+XSD_DATE = XSD.date.n3()
+XSD_DATETIME = XSD.dateTime.n3()
+XSD_DOUBLE = XSD.double.n3()
+XSD_INTEGER = XSD.integer.n3()
+
+# N-Triples string escapes; the regex lets plain strings skip the translate copy
+_NT_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+_NT_NEEDS_ESCAPE = re.compile(r'["\\\n\r]')
+
+
+def _nt_escape(value: str) -> str:
+    """Escape a string for use inside an N-Triples literal"""
+    if _NT_NEEDS_ESCAPE.search(value) is None:
+        return value
+    return value.translate(_NT_ESCAPES)
+
+
+@lru_cache(maxsize=4096)
+def _nt_string_literal(value: str) -> str:
+    """Render a plain string as an N-Triples literal (names and types repeat across twins)"""
+    return f'"{_nt_escape(value)}"'
+
+
+def _nt_literal(value: Any, datatype: Optional[str] = None) -> str:
+    """
+    Render a Python value as an N-Triples literal
+
+    Datatypes are inferred from the Python type the same way rdflib.Literal does
+    (bool, int, float, date/datetime); an explicit datatype overrides the inference.
+    """
+    if datatype is None and type(value) is str:
+        return _nt_string_literal(value)
+
+    # Booleans and numbers never contain characters that need escaping
+    if isinstance(value, bool):
+        return f'"{"true" if value else "false"}"^^{datatype or XSD_BOOLEAN}'
+    if isinstance(value, int):
+        return f'"{value}"^^{datatype or XSD_INTEGER}'
+    if isinstance(value, float):
+        return f'"{value!r}"^^{datatype or XSD_DOUBLE}'
+
+    if isinstance(value, datetime):
+        lexical = value.isoformat()
+        datatype = datatype or XSD_DATETIME
+    elif isinstance(value, date):
+        lexical = value.isoformat()
+        datatype = datatype or XSD_DATE
+    else:
+        lexical = _nt_escape(str(value))
+
+    if datatype:
+        return f'"{lexical}"^^{datatype}'
+    return f'"{lexical}"'
+
+
+def _nt_term_literal(literal: Literal) -> str:
+    """
+    Render an rdflib Literal in N-Triples form
+
+    Literal.n3() uses Turtle's triple-quoted form for strings containing
+    newlines, which N-Triples does not allow.
+    """
+    lexical = f'"{_nt_escape(str(literal))}"'
+    if literal.language:
+        return f"{lexical}@{literal.language}"
+    if literal.datatype:
+        return f"{lexical}^^<{literal.datatype}>"
+    return lexical
+
+
+def _nt_datetime_literal(value: Any) -> str:
+    """Render a generated-at timestamp (datetime or ISO string) as an xsd:dateTime literal"""
+    lexical = value.isoformat() if isinstance(value, datetime) else str(value)
+    return f'"{_nt_escape(lexical)}"^^{XSD_DATETIME}'
+
+
+def _nt_boolean_literal(value: Any) -> str:
+    """Render a value as an xsd:boolean literal"""
+    return _nt_literal(value, XSD_BOOLEAN)
+
+
+# Optional YAML fields emitted as literal triples: (key, predicate, literal renderer).
+# Fields whose value is None or "" are skipped.
+_INTERFACE_LABEL_FIELDS = (
+    ("generated-by", TS_GENERATED_BY, _nt_literal),
+    ("generated-at", TS_GENERATED_AT, _nt_datetime_literal),
+    ("thing-type", TS_THING_TYPE, _nt_literal),
+)
+_INSTANCE_LABEL_FIELDS = (
+    ("generated-by", TS_GENERATED_BY, _nt_literal),
+    ("generated-at", TS_GENERATED_AT, _nt_datetime_literal),
+)
+_INTERFACE_ANNOTATION_FIELDS = (
+    ("source", TS_SOURCE_FORMAT, _nt_literal),
+    ("original-id", TS_ORIGINAL_ID, _nt_literal),
+    # Domain metadata
+    ("manufacturer", TS_MANUFACTURER, _nt_literal),
+    ("model", TS_MODEL, _nt_literal),
+    ("serialNumber", TS_SERIAL_NUMBER, _nt_literal),
+    ("firmwareVersion", TS_FIRMWARE_VERSION, _nt_literal),
+    # DTDL metadata
+    ("dtdl-interface", TS_DTDL_INTERFACE, _nt_literal),
+    ("dtdl-interface-name", TS_DTDL_INTERFACE_NAME, _nt_literal),
+    ("dtdl-category", TS_DTDL_CATEGORY, _nt_literal),
+)
+_DESCRIPTION_FIELDS = (
+    ("description", TS_DESCRIPTION, _nt_literal),
+)
+_PROPERTY_FIELDS = (
+    ("description", TS_DESCRIPTION, _nt_literal),
+    ("x-writable", TS_WRITABLE, _nt_boolean_literal),
+    ("x-minimum", TS_MINIMUM, _nt_literal),
+    ("x-maximum", TS_MAXIMUM, _nt_literal),
+    ("x-unit", TS_UNIT, _nt_literal),
+)
+
+
+def _emit_fields(out: List[str], subject: str, data: Dict[str, Any], fields: Tuple) -> None:
+    """Append one triple per present field of a table-driven field map"""
+    for key, predicate, render in fields:
+        value = data.get(key)
+        if value is None or value == "":
+            continue
+        out.append(f"{subject} {predicate} {render(value)} .\n")
+
+
+# SPARQL string literal escapes (quotes, backslash and control characters)
+_SPARQL_STR_ESC = str.maketrans({
+    "\\": "\\\\", '"': '\\"', "'": "\\'",
+    "\n": "\\n", "\r": "\\r", "\t": "\\t",
+})
+
+
+def _sparql_escape(value: str) -> str:
+    """Escape a value for use inside a quoted SPARQL string literal"""
+    return value.translate(_SPARQL_STR_ESC)
+
+
+@lru_cache(maxsize=256)
+def _tenant_only_graph_filter(tenant_id: Optional[str]) -> str:
+    """
+    FILTER clause restricting ?graph to one tenant's named graphs
+
+    Cache invalidation mirrors this in _tenant_only_graphs_read.
+    """
+    if not tenant_id:
+        return ""
+    return f"FILTER(STRSTARTS(STR(?graph), 'http://twin.io/graphs/{_sparql_escape(tenant_id)}/'))"
+
+
+@lru_cache(maxsize=256)
+def _tenant_graph_filter(tenant_id: Optional[str]) -> str:
+    """
+    FILTER clause restricting ?graph to a tenant's graphs plus the default tenant's
+
+    Cache invalidation mirrors this in _tenant_and_default_graphs_read.
+    """
+    if not tenant_id or tenant_id == "default":
+        return ""
+    return (
+        f"FILTER("
+        f"STRSTARTS(STR(?graph), 'http://twin.io/graphs/{_sparql_escape(tenant_id)}/') "
+        f"|| STRSTARTS(STR(?graph), 'http://twin.io/graphs/default/')"
+        f")"
+    )
+
+
+# Characters that may not appear inside a SPARQL IRIREF (<...>)
+_IRI_FORBIDDEN = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+
+def _safe_iri(iri: str) -> str:
+    """
+    Validate an IRI before it is written into a query as <iri>
+
+    Raises:
+        ValueError: If the IRI contains characters that could break out of the IRIREF
+    """
+    if _IRI_FORBIDDEN.search(iri):
+        raise ValueError(f"Invalid IRI: {iri!r}")
+    return iri
+
+
+# Namespace prefixes shared by every SPARQL query
+_SPARQL_PREFIXES = f"""
+            PREFIX ts: <{TWIN}>
+            PREFIX tsd: <{TWIN_DATA}>
+"""
+
 
 class TwinRDFService:
     """Service for managing Twin data in RDF format"""
 
+    # SPARQL query skeletons, built once; only the variable parts are
+    # substituted per request via str.format
+    _SPARQL_TEMPLATES = {
+        "interfaces": _SPARQL_PREFIXES + """
+            SELECT DISTINCT ?interface ?name ?description ?generatedAt ?graph
+            WHERE {{
+                GRAPH ?graph {{
+                    ?interface a ts:TwinInterface .
+                    FILTER NOT EXISTS {{ ?interface a ts:TwinInstance }}
+                    ?interface ts:name ?name .
+                    OPTIONAL {{ ?interface ts:description ?description }}
+                    OPTIONAL {{ ?interface ts:generatedAt ?generatedAt }}
+                    {filter_clause}
+                }}
+                {graph_filter}
+            }}
+            ORDER BY ?name
+            LIMIT {limit}
+            """,
+        "instances": _SPARQL_PREFIXES + """
+            SELECT ?instance ?name ?interfaceName ?graph
+            WHERE {{
+                GRAPH ?graph {{
+                    ?instance a ts:TwinInstance .
+                    ?instance ts:name ?name .
+                    ?instance ts:instanceOf ?interface .
+                    ?interface ts:name ?interfaceName .
+                    {interface_filter}
+                }}
+                {graph_filter}
+            }}
+            ORDER BY ?name
+            LIMIT {limit}
+            """,
+        # Interface details are fetched as four narrow queries (run concurrently)
+        # so properties, relationships and commands don't join into a cross product
+        "interface_meta": _SPARQL_PREFIXES + """
+            SELECT ?name ?description ?generatedAt ?generatedBy ?graph
+            WHERE {{
+                GRAPH ?graph {{
+                    <{interface_uri}> a ts:TwinInterface .
+                    <{interface_uri}> ts:name ?name .
+                    OPTIONAL {{ <{interface_uri}> ts:description ?description }}
+                    OPTIONAL {{ <{interface_uri}> ts:generatedAt ?generatedAt }}
+                    OPTIONAL {{ <{interface_uri}> ts:generatedBy ?generatedBy }}
+                }}
+                {graph_filter}
+            }}
+            LIMIT 1
+            """,
+        "interface_properties": _SPARQL_PREFIXES + """
+            SELECT DISTINCT ?propName ?propType ?propDesc ?writable
+            WHERE {{
+                GRAPH ?graph {{
+                    <{interface_uri}> ts:hasProperty ?prop .
+                    ?prop ts:propertyName ?propName .
+                    ?prop ts:propertyType ?propType .
+                    OPTIONAL {{ ?prop ts:description ?propDesc }}
+                    OPTIONAL {{ ?prop ts:writable ?writable }}
+                }}
+                {graph_filter}
+            }}
+            """,
+        "interface_relationships": _SPARQL_PREFIXES + """
+            SELECT DISTINCT ?relName ?relTarget ?relDesc
+            WHERE {{
+                GRAPH ?graph {{
+                    <{interface_uri}> ts:hasRelationship ?rel .
+                    ?rel ts:relationshipName ?relName .
+                    ?rel ts:targetInterface ?relTarget .
+                    OPTIONAL {{ ?rel ts:description ?relDesc }}
+                }}
+                {graph_filter}
+            }}
+            """,
+        "interface_commands": _SPARQL_PREFIXES + """
+            SELECT DISTINCT ?cmdName ?cmdDesc
+            WHERE {{
+                GRAPH ?graph {{
+                    <{interface_uri}> ts:hasCommand ?cmd .
+                    ?cmd ts:commandName ?cmdName .
+                    OPTIONAL {{ ?cmd ts:description ?cmdDesc }}
+                }}
+                {graph_filter}
+            }}
+            """,
+        "search": _SPARQL_PREFIXES + """
+            SELECT DISTINCT ?uri ?name ?type ?description ?graph ?originalId ?thingType
+            WHERE {{
+                # Match first and cap the candidate set, so the OPTIONAL
+                # lookups below only run on the rows that are returned
+                {{
+                    SELECT DISTINCT ?uri ?name ?graph
+                    WHERE {{
+                        GRAPH ?graph {{
+                            ?uri ts:name ?name .
+                            ?uri a ?matchType .
+                            FILTER(?matchType IN (ts:TwinInterface, ts:TwinInstance))
+                            OPTIONAL {{ ?uri ts:description ?matchDescription }}
+                            OPTIONAL {{ ?uri ts:originalId ?matchOriginalId }}
+                        }}
+                        {graph_filter}
+                        FILTER(
+                            CONTAINS(LCASE(STR(?name)), "{lc_query}")
+                            || CONTAINS(LCASE(STR(?graph)), "{lc_query}")
+                            || (BOUND(?matchDescription) && CONTAINS(LCASE(STR(?matchDescription)), "{lc_query}"))
+                            || (BOUND(?matchOriginalId) && CONTAINS(LCASE(STR(?matchOriginalId)), "{lc_query}"))
+                        )
+                    }}
+                    ORDER BY ?name
+                    LIMIT {limit}
+                }}
+                GRAPH ?graph {{
+                    ?uri a ?type .
+                    FILTER(?type IN (ts:TwinInterface, ts:TwinInstance))
+                    OPTIONAL {{ ?uri ts:description ?description }}
+                    OPTIONAL {{ ?uri ts:originalId ?originalId }}
+                    OPTIONAL {{ ?uri ts:thingType ?thingType }}
+                }}
+            }}
+            ORDER BY ?name
+            LIMIT {limit}
+            """,
+        "all_things": _SPARQL_PREFIXES + """
+            SELECT ?uri ?name ?type ?description ?graph ?originalId ?thingType
+            WHERE {{
+                GRAPH ?graph {{
+                    ?uri ts:name ?name .
+                    ?uri a ?type .
+                    FILTER(?type IN (ts:TwinInterface, ts:TwinInstance))
+                    OPTIONAL {{ ?uri ts:description ?description }}
+                    OPTIONAL {{ ?uri ts:originalId ?originalId }}
+                    OPTIONAL {{ ?uri ts:thingType ?thingType }}
+                }}
+                {graph_filter}
+            }}
+            ORDER BY ?name
+            OFFSET {offset}
+            LIMIT {limit}
+            """,
+        "thing_by_id": _SPARQL_PREFIXES + """
+            SELECT ?uri ?name ?type ?description ?graph ?originalId ?thingType
+                   ?propName ?propType ?propDesc
+            WHERE {{
+                # Resolve the id to a single thing before fetching its details
+                {{
+                    SELECT ?uri ?name ?graph
+                    WHERE {{
+                        GRAPH ?graph {{
+                            ?uri a ?matchType .
+                            ?uri ts:name ?name .
+                            FILTER(?matchType IN (ts:TwinInterface, ts:TwinInstance))
+                            FILTER(
+                                STR(?uri) = "{safe_id}"
+                                || STR(?name) = "{safe_id}"
+                                || CONTAINS(STR(?graph), "{safe_id}")
+                            )
+                        }}
+                        {graph_filter}
+                    }}
+                    LIMIT 1
+                }}
+                GRAPH ?graph {{
+                    ?uri a ?type .
+                    FILTER(?type IN (ts:TwinInterface, ts:TwinInstance))
+                    OPTIONAL {{ ?uri ts:description ?description }}
+                    OPTIONAL {{ ?uri ts:originalId ?originalId }}
+                    OPTIONAL {{ ?uri ts:thingType ?thingType }}
+                    OPTIONAL {{
+                        ?uri ts:hasProperty ?prop .
+                        ?prop ts:propertyName ?propName .
+                        ?prop ts:propertyType ?propType .
+                        OPTIONAL {{ ?prop ts:description ?propDesc }}
+                    }}
+                }}
+            }}
+            """,
+        "search_by_property": _SPARQL_PREFIXES + """
+            SELECT DISTINCT ?interface ?name ?propName ?propType ?propMin ?propMax ?unit ?description ?graph ?thingType
+            WHERE {{
+                GRAPH ?graph {{
+                    ?interface a ts:TwinInterface .
+                    ?interface ts:name ?name .
+                    ?interface ts:hasProperty ?prop .
+                    ?prop ts:propertyName ?propName .
+                    ?prop ts:propertyType ?propType .
+                    FILTER(CONTAINS(LCASE(STR(?propName)), "{safe_prop}"))
+                    OPTIONAL {{ ?prop ts:minimum ?propMin }}
+                    OPTIONAL {{ ?prop ts:maximum ?propMax }}
+                    OPTIONAL {{ ?prop ts:unit ?unit }}
+                    OPTIONAL {{ ?interface ts:description ?description }}
+                    OPTIONAL {{ ?interface ts:thingType ?thingType }}
+                }}
+                {graph_filter}
+                FILTER(true {value_filter})
+            }}
+            ORDER BY ?name
+            LIMIT {limit}
+            """,
+        "instance_relationships": _SPARQL_PREFIXES + """
+            SELECT ?relName ?targetInstance ?targetInterface ?graph
+            WHERE {{
+                GRAPH ?graph {{
+                    <{instance_uri}> ts:hasInstanceRelationship ?rel .
+                    ?rel ts:relationshipName ?relName .
+                    ?rel ts:targetInstance ?target .
+                    ?target ts:name ?targetInstance .
+                    ?target ts:instanceOf ?interface .
+                    ?interface ts:name ?targetInterface .
+                }}
+                {graph_filter}
+            }}
+            """,
+    }
+
+    _QUERY_HEADERS = {
+        "Accept": "application/sparql-results+json",
+        "Accept-Encoding": "gzip, deflate",
+        "Content-Type": "application/sparql-query",
+    }
+
+    # Internal queries read CSV results; set False to fall back to SPARQL JSON
+    _CSV_RESULTS = True
+    _CSV_QUERY_HEADERS = {
+        "Accept": "text/csv",
+        "Accept-Encoding": "gzip, deflate",
+        "Content-Type": "application/sparql-query",
+    }
+
+    # search_by_property range filters, compared against the property's schema min/max
+    # (unknown operators, including "ne", apply no range filter)
+    _VALUE_FILTERS = {
+        "gt": "&& (?propMax > {value} || !BOUND(?propMax))",
+        "gte": "&& (?propMax >= {value} || !BOUND(?propMax))",
+        "lt": "&& (?propMin < {value} || !BOUND(?propMin))",
+        "lte": "&& (?propMin <= {value} || !BOUND(?propMin))",
+        "eq": "&& (?propMin <= {value} || !BOUND(?propMin)) && (?propMax >= {value} || !BOUND(?propMax))",
+    }
+
+    # ?type is restricted to ts:TwinInterface / ts:TwinInstance by the queries above
+    _TWIN_INTERFACE_URI = str(TWIN.TwinInterface)
+
     def __init__(self, username: str = None, password: str = None):
         """
         Initialize Twin RDF Service
@@ -52,12 +747,13 @@ class TwinRDFService:
 
         self.username = username or settings.FUSEKI_USERNAME
         self.password = password or settings.FUSEKI_PASSWORD
+        self.auth = aiohttp.BasicAuth(self.username, self.password)
 
         # Namespaces
         self.TS = TWIN
         self.TSD = TWIN_DATA
 
-        logger.info(f"TwinRDFService initialized with endpoint: {self.endpoint}")
+        logger.info("TwinRDFService initialized with endpoint: %s", self.endpoint)
 
     # ========================================================================
     # Public API - Store Operations
@@ -86,23 +782,10 @@ class TwinRDFService:
             FusekiException: If storage fails
         """
         try:
-            # Parse YAML
-            interface_data = yaml.safe_load(interface_yaml)
-            instance_data = yaml.safe_load(instance_yaml)
-
-            # Convert to RDF
-            graph = Graph()
-            graph.bind("ts", self.TS)
-            graph.bind("tsd", self.TSD)
-            graph.bind("rdf", RDF)
-            graph.bind("rdfs", RDFS)
-            graph.bind("xsd", XSD)
-
-            # Add interface triples
-            self._add_interface_to_graph(graph, interface_data, metadata)
-
-            # Add instance triples
-            self._add_instance_to_graph(graph, instance_data, metadata)
+            # Parse YAML and convert to N-Triples off the event loop (CPU-bound)
+            ntriples = await asyncio.to_thread(
+                self._build_twin_ntriples, interface_yaml, instance_yaml, metadata
+            )
 
             # Get tenant_id from metadata
             tenant_id = metadata.get("tenant_id", "default") if metadata else "default"
@@ -111,15 +794,44 @@ class TwinRDFService:
             graph_uri = f"http://twin.io/graphs/{tenant_id}/{thing_id}"
 
             # Store in Fuseki as Named Graph
-            await self._store_named_graph(graph, graph_uri)
+            await self._store_named_graph(ntriples, graph_uri)
+            _invalidate_read_caches(tenant_id)
 
-            logger.info(f"Successfully stored Twin RDF for thing: {thing_id} in graph: {graph_uri}")
+            logger.info("Successfully stored Twin RDF for thing: %s in graph: %s", thing_id, graph_uri)
             return True
 
         except Exception as e:
             logger.error(f"Failed to store Twin RDF: {str(e)}")
             raise FusekiException(f"Failed to store Twin RDF: {str(e)}")
 
+    async def store_twins_yaml(
+        self,
+        twins: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> List[bool]:
+        """
+        Store several Twins concurrently, each in its own Named Graph
+
+        Uploads share the pooled Fuseki session and are bounded by the module
+        write semaphore.
+
+        Args:
+            twins: Dicts with "interface_yaml", "instance_yaml" and "thing_id"
+            metadata: Metadata applied to every twin (should include tenant_id)
+
+        Returns:
+            List of results in input order
+
+        Raises:
+            FusekiException: If any twin fails to store
+        """
+        return list(await asyncio.gather(*(
+            self.store_twin_yaml(
+                twin["interface_yaml"], twin["instance_yaml"], twin["thing_id"], metadata
+            )
+            for twin in twins
+        )))
+
     async def delete_twin(self, interface_name: str, tenant_id: str = "default") -> bool:
         """
         Delete Twin interface and all its instances from Fuseki by dropping the named graph
@@ -143,19 +855,18 @@ class TwinRDFService:
                 thing_id_part
             ]
 
-            # Try to find and drop the graph
-            for thing_id in possible_thing_ids:
-                graph_uri = f"http://twin.io/graphs/{tenant_id}/{thing_id}"
-
-                # DROP GRAPH query
-                query = f"""
-                DROP SILENT GRAPH <{graph_uri}>
-                """
+            graph_uris = [
+                f"http://twin.io/graphs/{tenant_id}/{thing_id}"
+                for thing_id in possible_thing_ids
+            ]
 
-                await self._execute_update(query)
-                logger.info(f"Attempted to delete graph: {graph_uri}")
+            # Drop every candidate graph in a single multi-statement update
+            await self._execute_updates([f"DROP SILENT GRAPH <{_safe_iri(graph_uri)}>" for graph_uri in graph_uris])
+            _invalidate_read_caches(tenant_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Attempted to delete graphs: %s", ", ".join(graph_uris))
 
-            logger.info(f"Deleted Twin data for interface: {interface_name}")
+            logger.info("Deleted Twin data for interface: %s", interface_name)
             return True
 
         except Exception as e:
@@ -186,34 +897,19 @@ class TwinRDFService:
         try:
             filter_clause = ""
             if name_filter:
-                filter_clause = f'FILTER(CONTAINS(LCASE(?name), "{name_filter.lower()}"))'
+                filter_clause = f'FILTER(CONTAINS(LCASE(?name), "{_sparql_escape(name_filter.lower())}"))'
 
             # Build tenant graph filter
             graph_filter = self._build_tenant_graph_filter(tenant_id)
 
             # Query across all named graphs - only TwinInterface, not TwinInstance
-            query = f"""
-            PREFIX ts: <{self.TS}>
-            PREFIX tsd: <{self.TSD}>
-
-            SELECT DISTINCT ?interface ?name ?description ?generatedAt ?graph
-            WHERE {{
-                GRAPH ?graph {{
-                    ?interface a ts:TwinInterface .
-                    FILTER NOT EXISTS {{ ?interface a ts:TwinInstance }}
-                    ?interface ts:name ?name .
-                    OPTIONAL {{ ?interface ts:description ?description }}
-                    OPTIONAL {{ ?interface ts:generatedAt ?generatedAt }}
-                    {filter_clause}
-                }}
-                {graph_filter}
-            }}
-            ORDER BY ?name
-            LIMIT {limit}
-            """
+            query = self._SPARQL_TEMPLATES["interfaces"].format(
+                filter_clause=filter_clause,
+                graph_filter=graph_filter,
+                limit=limit
+            )
 
-            results = await self._execute_query(query)
-            return self._parse_sparql_results(results)
+            return await self._select(query)
 
         except Exception as e:
             logger.error(f"Failed to query interfaces: {str(e)}")
@@ -239,40 +935,45 @@ class TwinRDFService:
         try:
             interface_filter = ""
             if interface_name:
-                interface_uri = create_interface_uri(interface_name)
+                interface_uri = _safe_iri(create_interface_uri(interface_name))
                 interface_filter = f"?instance ts:instanceOf <{interface_uri}> ."
 
             # Add tenant filter if provided
-            graph_filter = ""
-            if tenant_id:
-                graph_filter = f"FILTER(STRSTARTS(STR(?graph), 'http://twin.io/graphs/{tenant_id}/'))"
+            graph_filter = _tenant_only_graph_filter(tenant_id)
 
-            query = f"""
-            PREFIX ts: <{self.TS}>
-            PREFIX tsd: <{self.TSD}>
+            query = self._SPARQL_TEMPLATES["instances"].format(
+                interface_filter=interface_filter,
+                graph_filter=graph_filter,
+                limit=limit
+            )
 
-            SELECT ?instance ?name ?interfaceName ?graph
-            WHERE {{
-                GRAPH ?graph {{
-                    ?instance a ts:TwinInstance .
-                    ?instance ts:name ?name .
-                    ?instance ts:instanceOf ?interface .
-                    ?interface ts:name ?interfaceName .
-                    {interface_filter}
-                }}
-                {graph_filter}
-            }}
-            ORDER BY ?name
-            LIMIT {limit}
-            """
-
-            results = await self._execute_query(query)
-            return self._parse_sparql_results(results)
+            return await self._select(query)
 
         except Exception as e:
             logger.error(f"Failed to query instances: {str(e)}")
             raise FusekiException(f"Failed to query instances: {str(e)}")
 
+    async def query_all(
+        self,
+        limit: int = 100,
+        tenant_id: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Query TwinInterfaces and TwinInstances concurrently
+
+        Args:
+            limit: Maximum number of results per kind
+            tenant_id: Optional tenant filter
+
+        Returns:
+            Dictionary with "interfaces" and "instances" lists
+        """
+        interfaces, instances = await asyncio.gather(
+            self.query_interfaces(limit=limit, tenant_id=tenant_id),
+            self.query_instances(limit=limit, tenant_id=tenant_id),
+        )
+        return {"interfaces": interfaces, "instances": instances}
+
     async def get_interface_details(self, interface_name: str, tenant_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a TwinInterface including properties, relationships, commands
@@ -284,60 +985,32 @@ class TwinRDFService:
         Returns:
             Dictionary with interface details or None if not found
         """
+        cache_key = (interface_name, tenant_id)
+        cached = _interface_details_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = _interface_details_cache.generation(cache_key)
+
         try:
-            interface_uri = create_interface_uri(interface_name)
+            interface_uri = _safe_iri(create_interface_uri(interface_name))
 
             # Add tenant filter if provided
-            graph_filter = ""
-            if tenant_id:
-                graph_filter = f"FILTER(STRSTARTS(STR(?graph), 'http://twin.io/graphs/{tenant_id}/'))"
-
-            query = f"""
-            PREFIX ts: <{self.TS}>
-            PREFIX tsd: <{self.TSD}>
-
-            SELECT ?name ?description ?generatedAt ?generatedBy
-                   ?propName ?propType ?propDesc ?writable
-                   ?relName ?relTarget ?relDesc
-                   ?cmdName ?cmdDesc ?graph
-            WHERE {{
-                GRAPH ?graph {{
-                    <{interface_uri}> a ts:TwinInterface .
-                    <{interface_uri}> ts:name ?name .
-                    OPTIONAL {{ <{interface_uri}> ts:description ?description }}
-                    OPTIONAL {{ <{interface_uri}> ts:generatedAt ?generatedAt }}
-                    OPTIONAL {{ <{interface_uri}> ts:generatedBy ?generatedBy }}
-
-                    # Properties
-                    OPTIONAL {{
-                        <{interface_uri}> ts:hasProperty ?prop .
-                        ?prop ts:propertyName ?propName .
-                        ?prop ts:propertyType ?propType .
-                        OPTIONAL {{ ?prop ts:description ?propDesc }}
-                        OPTIONAL {{ ?prop ts:writable ?writable }}
-                    }}
-
-                    # Relationships
-                    OPTIONAL {{
-                        <{interface_uri}> ts:hasRelationship ?rel .
-                        ?rel ts:relationshipName ?relName .
-                        ?rel ts:targetInterface ?relTarget .
-                        OPTIONAL {{ ?rel ts:description ?relDesc }}
-                    }}
-
-                    # Commands
-                    OPTIONAL {{
-                        <{interface_uri}> ts:hasCommand ?cmd .
-                        ?cmd ts:commandName ?cmdName .
-                        OPTIONAL {{ ?cmd ts:description ?cmdDesc }}
-                    }}
-                }}
-                {graph_filter}
-            }}
-            """
-
-            results = await self._execute_query(query)
-            return self._parse_interface_details(results)
+            graph_filter = _tenant_only_graph_filter(tenant_id)
+
+            meta, properties, relationships, commands = await asyncio.gather(*(
+                self._select(self._SPARQL_TEMPLATES[template].format(
+                    interface_uri=interface_uri,
+                    graph_filter=graph_filter
+                ))
+                for template in (
+                    "interface_meta", "interface_properties",
+                    "interface_relationships", "interface_commands",
+                )
+            ))
+            interface = self._parse_interface_details(meta, properties, relationships, commands)
+            if interface is not None:
+                _interface_details_cache.set(cache_key, interface, generation)
+            return interface
 
         except Exception as e:
             logger.error(f"Failed to get interface details: {str(e)}")
@@ -365,54 +1038,20 @@ class TwinRDFService:
         try:
             graph_filter = self._build_tenant_graph_filter(tenant_id)
 
-            safe_query = query.replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'")
-            lc_query = safe_query.lower()
+            lc_query = _sparql_escape(query.lower())
 
             # Use UNION pattern to search across different fields
             # This avoids issues with OPTIONAL + FILTER interactions in Fuseki
-            sparql = f"""
-            PREFIX ts: <{self.TS}>
-            PREFIX tsd: <{self.TSD}>
+            sparql = self._SPARQL_TEMPLATES["search"].format(
+                graph_filter=graph_filter,
+                lc_query=lc_query,
+                limit=limit
+            )
 
-            SELECT DISTINCT ?uri ?name ?type ?description ?graph ?originalId ?thingType
-            WHERE {{
-                GRAPH ?graph {{
-                    ?uri ts:name ?name .
-                    ?uri a ?type .
-                    FILTER(?type IN (ts:TwinInterface, ts:TwinInstance))
-                    OPTIONAL {{ ?uri ts:description ?description }}
-                    OPTIONAL {{ ?uri ts:originalId ?originalId }}
-                    OPTIONAL {{ ?uri ts:thingType ?thingType }}
-                }}
-                {graph_filter}
-                FILTER(
-                    CONTAINS(LCASE(STR(?name)), "{lc_query}")
-                    || CONTAINS(LCASE(STR(?graph)), "{lc_query}")
-                    || (BOUND(?description) && CONTAINS(LCASE(STR(?description)), "{lc_query}"))
-                    || (BOUND(?originalId) && CONTAINS(LCASE(STR(?originalId)), "{lc_query}"))
-                )
-            }}
-            ORDER BY ?name
-            LIMIT {limit}
-            """
-
-            results = await self._execute_query(sparql)
-            parsed = self._parse_sparql_results(results)
+            rows = await self._select_rows(sparql)
 
             # Normalize results for frontend consumption
-            items = []
-            for row in parsed:
-                item = {
-                    "id": row.get("uri", ""),
-                    "name": row.get("name", ""),
-                    "type": "TwinInterface" if "TwinInterface" in row.get("type", "") else "TwinInstance",
-                    "description": row.get("description"),
-                    "graph": row.get("graph", ""),
-                    "originalId": row.get("originalId"),
-                    "thingType": row.get("thingType"),
-                }
-                items.append(item)
-            return items
+            return [self._row_to_item(row) for row in rows]
 
         except Exception as e:
             logger.error(f"Failed to search: {str(e)}")
@@ -440,42 +1079,15 @@ class TwinRDFService:
 
             offset = (page - 1) * page_size
 
-            query = f"""
-            PREFIX ts: <{self.TS}>
-            PREFIX tsd: <{self.TSD}>
+            query = self._SPARQL_TEMPLATES["all_things"].format(
+                graph_filter=graph_filter,
+                offset=offset,
+                limit=page_size
+            )
 
-            SELECT ?uri ?name ?type ?description ?graph ?originalId ?thingType
-            WHERE {{
-                GRAPH ?graph {{
-                    ?uri ts:name ?name .
-                    ?uri a ?type .
-                    FILTER(?type IN (ts:TwinInterface, ts:TwinInstance))
-                    OPTIONAL {{ ?uri ts:description ?description }}
-                    OPTIONAL {{ ?uri ts:originalId ?originalId }}
-                    OPTIONAL {{ ?uri ts:thingType ?thingType }}
-                }}
-                {graph_filter}
-            }}
-            ORDER BY ?name
-            OFFSET {offset}
-            LIMIT {page_size}
-            """
+            rows = await self._select_rows(query)
 
-            results = await self._execute_query(query)
-            parsed = self._parse_sparql_results(results)
-
-            items = []
-            for row in parsed:
-                item = {
-                    "id": row.get("uri", ""),
-                    "name": row.get("name", ""),
-                    "type": "TwinInterface" if "TwinInterface" in row.get("type", "") else "TwinInstance",
-                    "description": row.get("description"),
-                    "graph": row.get("graph", ""),
-                    "originalId": row.get("originalId"),
-                    "thingType": row.get("thingType"),
-                }
-                items.append(item)
+            items = [self._row_to_item(row) for row in rows]
 
             return {
                 "items": items,
@@ -505,43 +1117,23 @@ class TwinRDFService:
         Returns:
             Thing details or None
         """
+        cache_key = (thing_id, tenant_id)
+        cached = _thing_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = _thing_cache.generation(cache_key)
+
         try:
             graph_filter = self._build_tenant_graph_filter(tenant_id)
 
-            safe_id = thing_id.replace('"', '\\"')
-
-            query = f"""
-            PREFIX ts: <{self.TS}>
-            PREFIX tsd: <{self.TSD}>
+            safe_id = _sparql_escape(thing_id)
 
-            SELECT ?uri ?name ?type ?description ?graph ?originalId ?thingType
-                   ?propName ?propType ?propDesc
-            WHERE {{
-                GRAPH ?graph {{
-                    ?uri a ?type .
-                    ?uri ts:name ?name .
-                    FILTER(?type IN (ts:TwinInterface, ts:TwinInstance))
-                    FILTER(
-                        STR(?uri) = "{safe_id}"
-                        || STR(?name) = "{safe_id}"
-                        || CONTAINS(STR(?graph), "{safe_id}")
-                    )
-                    OPTIONAL {{ ?uri ts:description ?description }}
-                    OPTIONAL {{ ?uri ts:originalId ?originalId }}
-                    OPTIONAL {{ ?uri ts:thingType ?thingType }}
-                    OPTIONAL {{
-                        ?uri ts:hasProperty ?prop .
-                        ?prop ts:propertyName ?propName .
-                        ?prop ts:propertyType ?propType .
-                        OPTIONAL {{ ?prop ts:description ?propDesc }}
-                    }}
-                }}
-                {graph_filter}
-            }}
-            """
+            query = self._SPARQL_TEMPLATES["thing_by_id"].format(
+                safe_id=safe_id,
+                graph_filter=graph_filter
+            )
 
-            results = await self._execute_query(query)
-            parsed = self._parse_sparql_results(results)
+            parsed = await self._select(query)
 
             if not parsed:
                 return None
@@ -552,7 +1144,7 @@ class TwinRDFService:
                 "@id": first.get("originalId") or first.get("name", ""),
                 "name": first.get("name", ""),
                 "title": first.get("name", ""),
-                "type": "TwinInterface" if "TwinInterface" in first.get("type", "") else "TwinInstance",
+                "type": "TwinInterface" if first.get("type") == self._TWIN_INTERFACE_URI else "TwinInstance",
                 "description": first.get("description"),
                 "graph": first.get("graph", ""),
                 "thingType": first.get("thingType"),
@@ -569,6 +1161,7 @@ class TwinRDFService:
                     }
                     seen_props.add(prop_name)
 
+            _thing_cache.set(cache_key, thing, generation)
             return thing
 
         except Exception as e:
@@ -579,8 +1172,7 @@ class TwinRDFService:
         """Check Fuseki connection health"""
         try:
             query = "SELECT (COUNT(*) AS ?count) WHERE { ?s ?p ?o } LIMIT 1"
-            results = await self._execute_query(query)
-            parsed = self._parse_sparql_results(results)
+            parsed = await self._select(query)
             triple_count = parsed[0].get("count", "0") if parsed else "0"
 
             return {
@@ -621,55 +1213,24 @@ class TwinRDFService:
         Returns:
             Dict with results list, count, and metadata
         """
-        import time
         start_time = time.time()
 
         try:
             graph_filter = self._build_tenant_graph_filter(tenant_id)
-            safe_prop = property_name.replace('"', '\\"').lower()
+            safe_prop = _sparql_escape(property_name.lower())
 
             # Build the value filter based on operator
             # We compare against the property's min/max range in the schema
-            value_filter = ""
-            if operator == "gt":
-                value_filter = f"&& (?propMax > {value} || !BOUND(?propMax))"
-            elif operator == "gte":
-                value_filter = f"&& (?propMax >= {value} || !BOUND(?propMax))"
-            elif operator == "lt":
-                value_filter = f"&& (?propMin < {value} || !BOUND(?propMin))"
-            elif operator == "lte":
-                value_filter = f"&& (?propMin <= {value} || !BOUND(?propMin))"
-            elif operator == "eq":
-                value_filter = f"&& (?propMin <= {value} || !BOUND(?propMin)) && (?propMax >= {value} || !BOUND(?propMax))"
-
-            sparql = f"""
-            PREFIX ts: <{self.TS}>
-            PREFIX tsd: <{self.TSD}>
+            value_filter = self._VALUE_FILTERS.get(operator, "").format(value=float(value))
 
-            SELECT DISTINCT ?interface ?name ?propName ?propType ?propMin ?propMax ?unit ?description ?graph ?thingType
-            WHERE {{
-                GRAPH ?graph {{
-                    ?interface a ts:TwinInterface .
-                    ?interface ts:name ?name .
-                    ?interface ts:hasProperty ?prop .
-                    ?prop ts:propertyName ?propName .
-                    ?prop ts:propertyType ?propType .
-                    FILTER(CONTAINS(LCASE(STR(?propName)), "{safe_prop}"))
-                    OPTIONAL {{ ?prop ts:minimum ?propMin }}
-                    OPTIONAL {{ ?prop ts:maximum ?propMax }}
-                    OPTIONAL {{ ?prop ts:unit ?unit }}
-                    OPTIONAL {{ ?interface ts:description ?description }}
-                    OPTIONAL {{ ?interface ts:thingType ?thingType }}
-                }}
-                {graph_filter}
-                FILTER(true {value_filter})
-            }}
-            ORDER BY ?name
-            LIMIT {limit}
-            """
+            sparql = self._SPARQL_TEMPLATES["search_by_property"].format(
+                safe_prop=safe_prop,
+                graph_filter=graph_filter,
+                value_filter=value_filter,
+                limit=limit
+            )
 
-            results = await self._execute_query(sparql)
-            parsed = self._parse_sparql_results(results)
+            parsed = await self._select(sparql)
 
             items = []
             for row in parsed:
@@ -718,34 +1279,26 @@ class TwinRDFService:
         Returns:
             List of relationship dictionaries
         """
+        cache_key = (instance_name, tenant_id)
+        cached = _relationships_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = _relationships_cache.generation(cache_key)
+
         try:
-            instance_uri = create_instance_uri(instance_name)
+            instance_uri = _safe_iri(create_instance_uri(instance_name))
 
             # Add tenant filter if provided
-            graph_filter = ""
-            if tenant_id:
-                graph_filter = f"FILTER(STRSTARTS(STR(?graph), 'http://twin.io/graphs/{tenant_id}/'))"
-
-            query = f"""
-            PREFIX ts: <{self.TS}>
-            PREFIX tsd: <{self.TSD}>
+            graph_filter = _tenant_only_graph_filter(tenant_id)
 
-            SELECT ?relName ?targetInstance ?targetInterface ?graph
-            WHERE {{
-                GRAPH ?graph {{
-                    <{instance_uri}> ts:hasInstanceRelationship ?rel .
-                    ?rel ts:relationshipName ?relName .
-                    ?rel ts:targetInstance ?target .
-                    ?target ts:name ?targetInstance .
-                    ?target ts:instanceOf ?interface .
-                    ?interface ts:name ?targetInterface .
-                }}
-                {graph_filter}
-            }}
-            """
+            query = self._SPARQL_TEMPLATES["instance_relationships"].format(
+                instance_uri=instance_uri,
+                graph_filter=graph_filter
+            )
 
-            results = await self._execute_query(query)
-            return self._parse_sparql_results(results)
+            relationships = await self._select(query)
+            _relationships_cache.set(cache_key, relationships, generation)
+            return relationships
 
         except Exception as e:
             logger.error(f"Failed to get instance relationships: {str(e)}")
@@ -762,153 +1315,127 @@ class TwinRDFService:
         When a specific tenant is provided, includes both that tenant's graphs
         and the 'default' tenant graphs (since things may be stored under default).
         """
-        if not tenant_id or tenant_id == "default":
-            return ""
-        return (
-            f"FILTER("
-            f"STRSTARTS(STR(?graph), 'http://twin.io/graphs/{tenant_id}/') "
-            f"|| STRSTARTS(STR(?graph), 'http://twin.io/graphs/default/')"
-            f")"
-        )
+        return _tenant_graph_filter(tenant_id)
 
     # ========================================================================
     # Private Helper Methods - RDF Conversion
     # ========================================================================
 
-    def _add_interface_to_graph(
+    def _build_twin_ntriples(
+        self,
+        interface_yaml: str,
+        instance_yaml: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Parse Twin YAML and render it as an N-Triples document (synchronous, run in a worker thread)"""
+        interface_data = yaml.load(interface_yaml, Loader=_YamlLoader)
+        instance_data = yaml.load(instance_yaml, Loader=_YamlLoader)
+
+        out: List[str] = []
+
+        # Add interface triples
+        self._emit_interface_ntriples(out, interface_data, metadata)
+
+        # Add instance triples
+        self._emit_instance_ntriples(out, instance_data, metadata)
+
+        return "".join(out)
+
+    def _emit_interface_ntriples(
         self,
-        graph: Graph,
+        out: List[str],
         interface_data: Dict[str, Any],
         metadata: Optional[Dict[str, Any]] = None
     ):
-        """Add TwinInterface to RDF graph"""
-        interface_name = interface_data["metadata"]["name"]
-        interface_uri = create_interface_uri(interface_name)
+        """Append TwinInterface triples to an N-Triples line buffer"""
+        meta = interface_data.get("metadata") or {}
+        labels = meta.get("labels") or {}
+        annotations = meta.get("annotations") or {}
+
+        interface_name = meta["name"]
+        interface_uri = f"<{create_interface_uri(interface_name)}>"
 
         # Interface type
-        graph.add((interface_uri, RDF.type, self.TS.TwinInterface))
-        graph.add((interface_uri, self.TS.name, Literal(interface_name)))
+        out.append(f"{interface_uri} {RDF_TYPE} {TS_TWIN_INTERFACE} .\n")
+        out.append(f"{interface_uri} {TS_NAME} {_nt_literal(interface_name)} .\n")
 
         # Metadata
-        if "labels" in interface_data["metadata"]:
-            labels = interface_data["metadata"]["labels"]
-            if "generated-by" in labels:
-                graph.add((interface_uri, self.TS.generatedBy, Literal(labels["generated-by"])))
-            if "generated-at" in labels:
-                graph.add((interface_uri, self.TS.generatedAt,
-                          Literal(labels["generated-at"], datatype=XSD.dateTime)))
-            # NEW: Thing Type
-            if "thing-type" in labels:
-                graph.add((interface_uri, self.TS.thingType, Literal(labels["thing-type"])))
-
-        if "annotations" in interface_data["metadata"]:
-            annotations = interface_data["metadata"]["annotations"]
-            if "source" in annotations:
-                graph.add((interface_uri, self.TS.sourceFormat, Literal(annotations["source"])))
-            if "original-id" in annotations:
-                graph.add((interface_uri, self.TS.originalId, Literal(annotations["original-id"])))
-            # NEW: Domain Metadata
-            if "manufacturer" in annotations:
-                graph.add((interface_uri, self.TS.manufacturer, Literal(annotations["manufacturer"])))
-            if "model" in annotations:
-                graph.add((interface_uri, self.TS.model, Literal(annotations["model"])))
-            if "serialNumber" in annotations:
-                graph.add((interface_uri, self.TS.serialNumber, Literal(annotations["serialNumber"])))
-            if "firmwareVersion" in annotations:
-                graph.add((interface_uri, self.TS.firmwareVersion, Literal(annotations["firmwareVersion"])))
-            # NEW: DTDL Metadata
-            if "dtdl-interface" in annotations:
-                graph.add((interface_uri, self.TS.dtdlInterface, Literal(annotations["dtdl-interface"])))
-            if "dtdl-interface-name" in annotations:
-                graph.add((interface_uri, self.TS.dtdlInterfaceName, Literal(annotations["dtdl-interface-name"])))
-            if "dtdl-category" in annotations:
-                graph.add((interface_uri, self.TS.dtdlCategory, Literal(annotations["dtdl-category"])))
-
-        spec = interface_data.get("spec", {})
+        _emit_fields(out, interface_uri, labels, _INTERFACE_LABEL_FIELDS)
+        _emit_fields(out, interface_uri, annotations, _INTERFACE_ANNOTATION_FIELDS)
+
+        spec = interface_data.get("spec") or {}
 
         # Properties
         for prop in spec.get("properties", []):
-            prop_uri = create_property_uri(interface_name, prop["name"])
-            graph.add((prop_uri, RDF.type, self.TS.Property))
-            graph.add((prop_uri, self.TS.propertyName, Literal(prop["name"])))
-            graph.add((prop_uri, self.TS.propertyType, Literal(prop["type"])))
-
-            if "description" in prop and prop["description"]:
-                graph.add((prop_uri, self.TS.description, Literal(prop["description"])))
-            if "x-writable" in prop:
-                graph.add((prop_uri, self.TS.writable, Literal(prop["x-writable"], datatype=XSD.boolean)))
-            if "x-minimum" in prop and prop["x-minimum"] is not None:
-                graph.add((prop_uri, self.TS.minimum, Literal(prop["x-minimum"])))
-            if "x-maximum" in prop and prop["x-maximum"] is not None:
-                graph.add((prop_uri, self.TS.maximum, Literal(prop["x-maximum"])))
-            if "x-unit" in prop and prop["x-unit"]:
-                graph.add((prop_uri, self.TS.unit, Literal(prop["x-unit"])))
-
-            graph.add((interface_uri, self.TS.hasProperty, prop_uri))
+            prop_name = prop["name"]
+            prop_uri = f"<{create_property_uri(interface_name, prop_name)}>"
+            out.append(f"{prop_uri} {RDF_TYPE} {TS_PROPERTY} .\n")
+            out.append(f"{prop_uri} {TS_PROPERTY_NAME} {_nt_literal(prop_name)} .\n")
+            out.append(f"{prop_uri} {TS_PROPERTY_TYPE} {_nt_literal(prop['type'])} .\n")
+
+            _emit_fields(out, prop_uri, prop, _PROPERTY_FIELDS)
+
+            out.append(f"{interface_uri} {TS_HAS_PROPERTY} {prop_uri} .\n")
 
         # Relationships
         for rel in spec.get("relationships", []):
-            rel_uri = create_relationship_uri(interface_name, rel["name"])
-            graph.add((rel_uri, RDF.type, self.TS.Relationship))
-            graph.add((rel_uri, self.TS.relationshipName, Literal(rel["name"])))
-            graph.add((rel_uri, self.TS.targetInterface, Literal(rel["interface"])))
+            rel_name = rel["name"]
+            rel_uri = f"<{create_relationship_uri(interface_name, rel_name)}>"
+            out.append(f"{rel_uri} {RDF_TYPE} {TS_RELATIONSHIP} .\n")
+            out.append(f"{rel_uri} {TS_RELATIONSHIP_NAME} {_nt_literal(rel_name)} .\n")
+            out.append(f"{rel_uri} {TS_TARGET_INTERFACE} {_nt_literal(rel['interface'])} .\n")
 
-            if "description" in rel and rel["description"]:
-                graph.add((rel_uri, self.TS.description, Literal(rel["description"])))
+            _emit_fields(out, rel_uri, rel, _DESCRIPTION_FIELDS)
 
-            graph.add((interface_uri, self.TS.hasRelationship, rel_uri))
+            out.append(f"{interface_uri} {TS_HAS_RELATIONSHIP} {rel_uri} .\n")
 
         # Commands
         for cmd in spec.get("commands", []):
-            cmd_uri = create_command_uri(interface_name, cmd["name"])
-            graph.add((cmd_uri, RDF.type, self.TS.Command))
-            graph.add((cmd_uri, self.TS.commandName, Literal(cmd["name"])))
+            cmd_name = cmd["name"]
+            cmd_uri = f"<{create_command_uri(interface_name, cmd_name)}>"
+            out.append(f"{cmd_uri} {RDF_TYPE} {TS_COMMAND} .\n")
+            out.append(f"{cmd_uri} {TS_COMMAND_NAME} {_nt_literal(cmd_name)} .\n")
 
-            if "description" in cmd and cmd["description"]:
-                graph.add((cmd_uri, self.TS.description, Literal(cmd["description"])))
+            _emit_fields(out, cmd_uri, cmd, _DESCRIPTION_FIELDS)
             if "schema" in cmd:
-                graph.add((cmd_uri, self.TS.schema, Literal(json.dumps(cmd["schema"]))))
+                out.append(f"{cmd_uri} {TS_SCHEMA} {_nt_literal(_dumps_schema(cmd['schema']))} .\n")
 
-            graph.add((interface_uri, self.TS.hasCommand, cmd_uri))
+            out.append(f"{interface_uri} {TS_HAS_COMMAND} {cmd_uri} .\n")
 
-    def _add_instance_to_graph(
+    def _emit_instance_ntriples(
         self,
-        graph: Graph,
+        out: List[str],
         instance_data: Dict[str, Any],
         metadata: Optional[Dict[str, Any]] = None
     ):
-        """Add TwinInstance to RDF graph"""
-        instance_name = instance_data["metadata"]["name"]
-        instance_uri = create_instance_uri(instance_name)
+        """Append TwinInstance triples to an N-Triples line buffer"""
+        meta = instance_data.get("metadata") or {}
+        labels = meta.get("labels") or {}
+        spec = instance_data["spec"]
+
+        instance_name = meta["name"]
+        instance_uri = f"<{create_instance_uri(instance_name)}>"
 
         # Instance type
-        graph.add((instance_uri, RDF.type, self.TS.TwinInstance))
-        graph.add((instance_uri, self.TS.name, Literal(instance_name)))
+        out.append(f"{instance_uri} {RDF_TYPE} {TS_TWIN_INSTANCE} .\n")
+        out.append(f"{instance_uri} {TS_NAME} {_nt_literal(instance_name)} .\n")
 
         # Interface reference
-        interface_name = instance_data["spec"]["interface"]
-        interface_uri = create_interface_uri(interface_name)
-        graph.add((instance_uri, self.TS.instanceOf, interface_uri))
+        out.append(f"{instance_uri} {TS_INSTANCE_OF} <{create_interface_uri(spec['interface'])}> .\n")
 
         # Metadata
-        if "labels" in instance_data["metadata"]:
-            labels = instance_data["metadata"]["labels"]
-            if "generated-by" in labels:
-                graph.add((instance_uri, self.TS.generatedBy, Literal(labels["generated-by"])))
-            if "generated-at" in labels:
-                graph.add((instance_uri, self.TS.generatedAt,
-                          Literal(labels["generated-at"], datatype=XSD.dateTime)))
-
-        # Instance relationships
-        for rel in instance_data["spec"].get("twinInstanceRelationships", []):
-            rel_node = BNode()
-            graph.add((rel_node, RDF.type, self.TS.InstanceRelationship))
-            graph.add((rel_node, self.TS.relationshipName, Literal(rel["name"])))
+        _emit_fields(out, instance_uri, labels, _INSTANCE_LABEL_FIELDS)
 
-            target_instance_uri = create_instance_uri(rel["instance"])
-            graph.add((rel_node, self.TS.targetInstance, target_instance_uri))
+        # Instance relationships (stable URIs, so re-storing an instance is idempotent)
+        for rel in spec.get("twinInstanceRelationships", []):
+            rel_name = rel["name"]
+            target_instance = rel["instance"]
+            rel_uri = f"<{create_instance_relationship_uri(instance_name, rel_name, target_instance)}>"
+            out.append(f"{rel_uri} {RDF_TYPE} {TS_INSTANCE_RELATIONSHIP} .\n")
+            out.append(f"{rel_uri} {TS_RELATIONSHIP_NAME} {_nt_literal(rel_name)} .\n")
+            out.append(f"{rel_uri} {TS_TARGET_INSTANCE} <{create_instance_uri(target_instance)}> .\n")
 
-            graph.add((instance_uri, self.TS.hasInstanceRelationship, rel_node))
+            out.append(f"{instance_uri} {TS_HAS_INSTANCE_RELATIONSHIP} {rel_uri} .\n")
 
     # ========================================================================
     # Private Helper Methods - Fuseki Communication
@@ -917,62 +1444,61 @@ class TwinRDFService:
     async def _store_graph(self, graph: Graph):
         """Store RDF graph in Fuseki default graph (deprecated - use _store_named_graph)"""
         try:
-            # Serialize to Turtle
-            turtle_data = graph.serialize(format="turtle")
-
-            async with aiohttp.ClientSession() as session:
-                auth = aiohttp.BasicAuth(self.username, self.password)
-                headers = {"Content-Type": "text/turtle"}
-
-                async with session.post(
-                    self.data_endpoint,
-                    data=turtle_data,
-                    headers=headers,
-                    auth=auth
-                ) as response:
-                    if response.status not in [200, 201, 204]:
-                        error_text = await response.text()
-                        raise FusekiException(
-                            f"Failed to store graph: {response.status} - {error_text}"
-                        )
+            session = await get_fuseki_session()
+            headers = {"Content-Type": "application/n-triples"}
+
+            # Stream N-Triples as a chunked request body
+            async with session.post(
+                self.data_endpoint,
+                data=aiter_ntriples(graph),
+                headers=headers,
+                auth=self.auth
+            ) as response:
+                if response.status not in [200, 201, 204]:
+                    error_text = await response.text()
+                    raise FusekiException(
+                        f"Failed to store graph: {response.status} - {error_text}"
+                    )
 
         except Exception as e:
             logger.error(f"Failed to store graph in Fuseki: {str(e)}")
             raise
 
-    async def _store_named_graph(self, graph: Graph, graph_uri: str):
+    async def _store_named_graph(self, ntriples: str, graph_uri: str):
         """
-        Store RDF graph in Fuseki as a Named Graph
+        Store RDF data in Fuseki as a Named Graph
 
         Args:
-            graph: RDF graph to store
+            ntriples: N-Triples document to store
             graph_uri: URI of the named graph (e.g., http://twin.io/graphs/tenant1/thing1)
         """
         try:
-            # Serialize to Turtle
-            turtle_data = graph.serialize(format="turtle")
-
-            async with aiohttp.ClientSession() as session:
-                auth = aiohttp.BasicAuth(self.username, self.password)
-                headers = {"Content-Type": "text/turtle"}
-
-                # Use PUT to create/replace named graph
-                # Fuseki endpoint: /data?graph=<uri>
-                named_graph_endpoint = f"{self.data_endpoint}?graph={graph_uri}"
-
-                async with session.put(
-                    named_graph_endpoint,
-                    data=turtle_data,
-                    headers=headers,
-                    auth=auth
-                ) as response:
-                    if response.status not in [200, 201, 204]:
-                        error_text = await response.text()
-                        raise FusekiException(
-                            f"Failed to store named graph: {response.status} - {error_text}"
-                        )
+            session = await get_fuseki_session()
+            headers = {"Content-Type": "application/n-triples"}
+            body = ntriples.encode("utf-8")
+
+            # Compress larger bodies when the server accepts gzip uploads
+            if settings.FUSEKI_GZIP_UPLOADS and len(body) > _GZIP_MIN_BYTES:
+                body = await asyncio.to_thread(gzip.compress, body, 5)
+                headers["Content-Encoding"] = "gzip"
+
+            # Use PUT to create/replace named graph
+            # Fuseki endpoint: /data?graph=<uri>
+            named_graph_endpoint = f"{self.data_endpoint}?graph={graph_uri}"
+
+            async with _get_write_semaphore(), session.put(
+                named_graph_endpoint,
+                data=body,
+                headers=headers,
+                auth=self.auth
+            ) as response:
+                if response.status not in [200, 201, 204]:
+                    error_text = await response.text()
+                    raise FusekiException(
+                        f"Failed to store named graph: {response.status} - {error_text}"
+                    )
 
-                    logger.info(f"Successfully stored named graph: {graph_uri}")
+                logger.info("Successfully stored named graph: %s", graph_uri)
 
         except Exception as e:
             logger.error(f"Failed to store named graph in Fuseki: {str(e)}")
@@ -981,121 +1507,192 @@ class TwinRDFService:
     async def _execute_query(self, query: str) -> Dict[str, Any]:
         """Execute SPARQL SELECT query"""
         try:
-            async with aiohttp.ClientSession() as session:
-                auth = aiohttp.BasicAuth(self.username, self.password)
-                headers = {"Accept": "application/sparql-results+json"}
-
-                async with session.post(
-                    self.query_endpoint,
-                    data={"query": query},
-                    headers=headers,
-                    auth=auth
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise FusekiException(
-                            f"SPARQL query failed: {response.status} - {error_text}"
-                        )
+            session = await get_fuseki_session()
+
+            # Send the query as a raw sparql-query body and ask for compressed JSON results
+            async with session.post(
+                self.query_endpoint,
+                data=query.encode("utf-8"),
+                headers=self._QUERY_HEADERS,
+                auth=self.auth
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise FusekiException(
+                        f"SPARQL query failed: {response.status} - {error_text}"
+                    )
 
-                    return await response.json()
+                return _json_loads(await response.read())
 
         except Exception as e:
             logger.error(f"Failed to execute SPARQL query: {str(e)}")
             raise
 
+    async def _execute_query_csv(self, query: str) -> str:
+        """
+        Execute SPARQL SELECT query requesting the CSV result format
+
+        CSV carries plain lexical values without the per-cell {"type", "value"}
+        objects of the JSON format. Empty cells (unbound variables) are left out
+        of the row, matching how unbound variables are absent from JSON bindings.
+        """
+        try:
+            session = await get_fuseki_session()
+
+            async with session.post(
+                self.query_endpoint,
+                data=query.encode("utf-8"),
+                headers=self._CSV_QUERY_HEADERS,
+                auth=self.auth
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise FusekiException(
+                        f"SPARQL query failed: {response.status} - {error_text}"
+                    )
+
+                return await response.text()
+
+        except Exception as e:
+            logger.error(f"Failed to execute SPARQL query: {str(e)}")
+            raise
+
+    async def _select_rows(self, query: str) -> Iterator[Dict[str, Any]]:
+        """Execute an internal SELECT query and return a lazy iterator of flat rows"""
+        if self._CSV_RESULTS:
+            return self._iter_csv_rows(await self._execute_query_csv(query))
+        return self._iter_sparql_rows(await self._execute_query(query))
+
+    async def _select(self, query: str) -> List[Dict[str, Any]]:
+        """Execute an internal SELECT query and return flat {variable: value} rows"""
+        return list(await self._select_rows(query))
+
     async def _execute_update(self, update: str):
         """Execute SPARQL UPDATE query"""
         try:
-            async with aiohttp.ClientSession() as session:
-                auth = aiohttp.BasicAuth(self.username, self.password)
-                headers = {"Content-Type": "application/sparql-update"}
-
-                async with session.post(
-                    self.update_endpoint,
-                    data=update,
-                    headers=headers,
-                    auth=auth
-                ) as response:
-                    if response.status not in [200, 204]:
-                        error_text = await response.text()
-                        raise FusekiException(
-                            f"SPARQL update failed: {response.status} - {error_text}"
-                        )
+            session = await get_fuseki_session()
+            headers = {"Content-Type": "application/sparql-update"}
+
+            async with session.post(
+                self.update_endpoint,
+                data=update,
+                headers=headers,
+                auth=self.auth
+            ) as response:
+                if response.status not in [200, 204]:
+                    error_text = await response.text()
+                    raise FusekiException(
+                        f"SPARQL update failed: {response.status} - {error_text}"
+                    )
 
         except Exception as e:
             logger.error(f"Failed to execute SPARQL update: {str(e)}")
             raise
 
+    async def _execute_updates(self, updates: List[str]):
+        """
+        Execute several SPARQL UPDATE operations in a single request
+
+        Operations are joined with ';' (SPARQL 1.1 Update request syntax),
+        so Fuseki applies them in one transaction and one round-trip.
+
+        Args:
+            updates: Update operations, executed in order
+        """
+        if not updates:
+            return
+        await self._execute_update(" ;\n".join(updates))
+
     # ========================================================================
     # Private Helper Methods - Result Parsing
     # ========================================================================
 
+    def _iter_csv_rows(self, text: str) -> Iterator[Dict[str, str]]:
+        """Yield SPARQL CSV result rows as dictionaries (unbound variables omitted)"""
+        reader = csv.reader(io.StringIO(text, newline=""))
+        header = next(reader, None)
+        if not header:
+            return
+        for row in reader:
+            yield {var: value for var, value in zip(header, row) if value}
+
+    def _iter_sparql_rows(self, results: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield SPARQL JSON result rows as flat {variable: value} dictionaries"""
+        for binding in results.get("results", {}).get("bindings", []):
+            yield {var: value.get("value") for var, value in binding.items()}
+
     def _parse_sparql_results(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Parse SPARQL JSON results into list of dictionaries"""
-        parsed = []
-        for binding in results.get("results", {}).get("bindings", []):
-            row = {}
-            for var, value in binding.items():
-                row[var] = value.get("value")
-            parsed.append(row)
-        return parsed
-
-    def _parse_interface_details(self, results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Parse interface details from SPARQL results"""
-        bindings = results.get("results", {}).get("bindings", [])
-        if not bindings:
+        return list(self._iter_sparql_rows(results))
+
+    def _row_to_item(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a search/listing result row for frontend consumption"""
+        return {
+            "id": row.get("uri", ""),
+            "name": row.get("name", ""),
+            "type": "TwinInterface" if row.get("type") == self._TWIN_INTERFACE_URI else "TwinInstance",
+            "description": row.get("description"),
+            "graph": row.get("graph", ""),
+            "originalId": row.get("originalId"),
+            "thingType": row.get("thingType"),
+        }
+
+    def _parse_interface_details(
+        self,
+        meta_rows: List[Dict[str, Any]],
+        property_rows: List[Dict[str, Any]],
+        relationship_rows: List[Dict[str, Any]],
+        command_rows: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Assemble interface details from the meta/property/relationship/command query rows"""
+        if not meta_rows:
             return None
 
-        # First binding has basic info
-        first = bindings[0]
+        first = meta_rows[0]
         interface = {
-            "name": first.get("name", {}).get("value"),
-            "description": first.get("description", {}).get("value"),
-            "generatedAt": first.get("generatedAt", {}).get("value"),
-            "generatedBy": first.get("generatedBy", {}).get("value"),
+            "name": first.get("name"),
+            "description": first.get("description"),
+            "generatedAt": first.get("generatedAt"),
+            "generatedBy": first.get("generatedBy"),
             "properties": [],
             "relationships": [],
             "commands": []
         }
 
-        # Collect properties, relationships, commands
+        # Rows are DISTINCT per query; names are still deduplicated in case the
+        # interface is stored in several graphs with differing details
         seen_props = set()
-        seen_rels = set()
-        seen_cmds = set()
+        for row in property_rows:
+            prop_name = row["propName"]
+            if prop_name not in seen_props:
+                seen_props.add(prop_name)
+                interface["properties"].append({
+                    "name": prop_name,
+                    "type": row.get("propType"),
+                    "description": row.get("propDesc"),
+                    "writable": row.get("writable") == "true"
+                })
 
-        for binding in bindings:
-            # Properties
-            if "propName" in binding:
-                prop_name = binding["propName"]["value"]
-                if prop_name not in seen_props:
-                    interface["properties"].append({
-                        "name": prop_name,
-                        "type": binding.get("propType", {}).get("value"),
-                        "description": binding.get("propDesc", {}).get("value"),
-                        "writable": binding.get("writable", {}).get("value") == "true"
-                    })
-                    seen_props.add(prop_name)
+        seen_rels = set()
+        for row in relationship_rows:
+            rel_name = row["relName"]
+            if rel_name not in seen_rels:
+                seen_rels.add(rel_name)
+                interface["relationships"].append({
+                    "name": rel_name,
+                    "targetInterface": row.get("relTarget"),
+                    "description": row.get("relDesc")
+                })
 
-            # Relationships
-            if "relName" in binding:
-                rel_name = binding["relName"]["value"]
-                if rel_name not in seen_rels:
-                    interface["relationships"].append({
-                        "name": rel_name,
-                        "targetInterface": binding.get("relTarget", {}).get("value"),
-                        "description": binding.get("relDesc", {}).get("value")
-                    })
-                    seen_rels.add(rel_name)
-
-            # Commands
-            if "cmdName" in binding:
-                cmd_name = binding["cmdName"]["value"]
-                if cmd_name not in seen_cmds:
-                    interface["commands"].append({
-                        "name": cmd_name,
-                        "description": binding.get("cmdDesc", {}).get("value")
-                    })
-                    seen_cmds.add(cmd_name)
+        seen_cmds = set()
+        for row in command_rows:
+            cmd_name = row["cmdName"]
+            if cmd_name not in seen_cmds:
+                seen_cmds.add(cmd_name)
+                interface["commands"].append({
+                    "name": cmd_name,
+                    "description": row.get("cmdDesc")
+                })
 
         return interface
 
@@ -1112,4 +1709,8 @@ def create_twin_rdf_service() -> TwinRDFService:
 __all__ = [
     "TwinRDFService",
     "create_twin_rdf_service",
+    "get_fuseki_session",
+    "close_fuseki_session",
+    "iter_ntriples",
+    "aiter_ntriples",
 ]
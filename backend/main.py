@@ -5,6 +5,7 @@ Lightweight Digital Twin management system using Twin YAML format.
 No Ditto, no WoT conversion - direct form-to-YAML-to-RDF workflow.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
@@ -25,49 +26,55 @@ settings = get_settings()
 
 async def ensure_fuseki_dataset():
     """Check if Fuseki dataset exists, create it and load ontology if not."""
-    import httpx
+    import aiohttp
     from app.core.twin_ontology import get_twin_ontology
+    from app.services.twin_rdf_service import aiter_ntriples, get_fuseki_session
 
     dataset = settings.FUSEKI_DATASET
     fuseki_url = settings.FUSEKI_URL
-    auth = (settings.FUSEKI_USERNAME, settings.FUSEKI_PASSWORD)
+    auth = aiohttp.BasicAuth(settings.FUSEKI_USERNAME, settings.FUSEKI_PASSWORD)
+    timeout = aiohttp.ClientTimeout(total=10.0)
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Check if dataset exists
-            resp = await client.get(f"{fuseki_url}/$/datasets", auth=auth)
-            if resp.status_code == 200:
-                existing = [ds.get("ds.name", "").strip("/") for ds in resp.json().get("datasets", [])]
+        # Shared pool with TwinRDFService, so the first requests reuse these connections
+        session = await get_fuseki_session()
+
+        # Check if dataset exists
+        async with session.get(f"{fuseki_url}/$/datasets", auth=auth, timeout=timeout) as resp:
+            if resp.status == 200:
+                body = await resp.json(content_type=None)
+                existing = [ds.get("ds.name", "").strip("/") for ds in body.get("datasets", [])]
                 if dataset in existing:
                     logger.info(f"Fuseki dataset '{dataset}' already exists")
                     return
 
-            # Create dataset
-            logger.info(f"Creating Fuseki dataset '{dataset}'...")
-            resp = await client.post(
-                f"{fuseki_url}/$/datasets",
-                data={"dbName": dataset, "dbType": "tdb2"},
-                auth=auth,
-            )
-            if resp.status_code not in [200, 201]:
-                logger.error(f"Failed to create dataset: {resp.status_code} - {resp.text}")
+        # Create dataset
+        logger.info(f"Creating Fuseki dataset '{dataset}'...")
+        async with session.post(
+            f"{fuseki_url}/$/datasets",
+            data={"dbName": dataset, "dbType": "tdb2"},
+            auth=auth,
+            timeout=timeout,
+        ) as resp:
+            if resp.status not in [200, 201]:
+                logger.error(f"Failed to create dataset: {resp.status} - {await resp.text()}")
                 return
-            logger.info(f"Fuseki dataset '{dataset}' created")
-
-            # Load ontology
-            logger.info("Loading Twin ontology into Fuseki...")
-            ontology = get_twin_ontology()
-            turtle_data = ontology.serialize(format="turtle")
-            resp = await client.post(
-                f"{fuseki_url}/{dataset}/data",
-                content=turtle_data,
-                headers={"Content-Type": "text/turtle"},
-                auth=auth,
-            )
-            if resp.status_code in [200, 201, 204]:
+        logger.info(f"Fuseki dataset '{dataset}' created")
+
+        # Load ontology
+        logger.info("Loading Twin ontology into Fuseki...")
+        ontology = get_twin_ontology()
+        async with session.post(
+            f"{fuseki_url}/{dataset}/data",
+            data=aiter_ntriples(ontology),
+            headers={"Content-Type": "application/n-triples"},
+            auth=auth,
+            timeout=timeout,
+        ) as resp:
+            if resp.status in [200, 201, 204]:
                 logger.info(f"Twin ontology loaded ({len(ontology)} triples)")
             else:
-                logger.error(f"Failed to load ontology: {resp.status_code} - {resp.text}")
+                logger.error(f"Failed to load ontology: {resp.status} - {await resp.text()}")
 
     except Exception as e:
         logger.warning(f"Could not ensure Fuseki dataset: {e}")
@@ -83,19 +90,25 @@ async def lifespan(app: FastAPI):
     logger.info(f"Fuseki URL: {settings.FUSEKI_URL}")
     logger.info("=" * 60)
     
-    # Initialize database
+    # Initialize database (in a worker thread) while ensuring the Fuseki
+    # dataset exists; neither step depends on the other
     from app.core.database import init_db
-    logger.info("Initializing database...")
-    init_db()
-    logger.info("Database initialized successfully")
 
-    # Ensure Fuseki dataset exists
-    await ensure_fuseki_dataset()
+    async def initialize_database():
+        logger.info("Initializing database...")
+        await asyncio.to_thread(init_db)
+        logger.info("Database initialized successfully")
+
+    await asyncio.gather(initialize_database(), ensure_fuseki_dataset())
 
     yield
 
     logger.info("Twin-Lite API Shutting down...")
 
+    # Release pooled Fuseki connections
+    from app.services.twin_rdf_service import close_fuseki_session
+    await close_fuseki_session()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -55,16 +55,17 @@ def create_default_tenants():
 
         print("\nCreating default tenants...")
 
-        for tenant_data in default_tenants:
-            # Check if tenant already exists
-            existing = tenant_manager.get_tenant_by_id(tenant_data["tenant_id"])
-
-            if existing:
-                print(f"  ⚠ Tenant '{tenant_data['tenant_id']}' already exists - skipping")
+        # One existence query and one commit for the whole batch
+        tenant_creates = [TenantCreate(**tenant_data) for tenant_data in default_tenants]
+        created_ids = {
+            tenant.tenant_id for tenant in tenant_manager.create_tenants(tenant_creates)
+        }
+
+        for tenant_create in tenant_creates:
+            if tenant_create.tenant_id in created_ids:
+                print(f"  ✓ Created tenant: {tenant_create.tenant_id} ({tenant_create.name})")
             else:
-                tenant_create = TenantCreate(**tenant_data)
-                created_tenant = tenant_manager.create_tenant(tenant_create)
-                print(f"  ✓ Created tenant: {created_tenant.tenant_id} ({created_tenant.name})")
+                print(f"  ⚠ Tenant '{tenant_create.tenant_id}' already exists - skipping")
 
         print("\n✅ Tenant initialization completed successfully!")
 
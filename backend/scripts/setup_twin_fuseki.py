@@ -8,22 +8,112 @@ Usage:
     python scripts/setup_twin_fuseki.py
 """
 
+import json
+import os
 import requests
 import sys
+import time
 import logging
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from rdflib import RDF, RDFS
+
 from app.core.config import get_settings
-from app.core.twin_ontology import get_twin_ontology
+from app.core.twin_ontology import get_twin_ontology, TWIN
+from app.services.twin_rdf_service import iter_ntriples
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# One pooled session for all setup phases (keeps the Fuseki connection alive)
+_session = requests.Session()
+_session.auth = (settings.FUSEKI_USERNAME, settings.FUSEKI_PASSWORD)
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Verification queries, kept as fixed canonical strings so repeated runs send
+# byte-identical requests (and hit any HTTP-layer query cache)
+#
+# Pattern order rule for any verification query: put the most selective
+# pattern first - bound subject/predicate/object URIs before variables - so
+# Fuseki resolves it from an index instead of scanning SPO.
+_ASK_QUERY = f"ASK {{ <{TWIN.TwinInterface}> <{RDF.type}> <{RDFS.Class}> }}"
+_COUNT_QUERY = "SELECT (COUNT(*) AS ?count) WHERE { ?s ?p ?o }"
+
+# On-disk cache of the GET /$/datasets listing, so repeated runs within the
+# TTL skip the existence round trip (FUSEKI_SETUP_CACHE_TTL=0 disables it)
+_DATASETS_CACHE_PATH = Path.home() / ".cache" / "twin-fuseki" / "datasets.json"
+_DATASETS_CACHE_DEFAULT_TTL = 60.0
+
+
+def _datasets_cache_ttl() -> float:
+    """Read FUSEKI_SETUP_CACHE_TTL, falling back to the default on a bad value"""
+    raw = os.environ.get("FUSEKI_SETUP_CACHE_TTL")
+    if raw is None:
+        return _DATASETS_CACHE_DEFAULT_TTL
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning(
+            f"Invalid FUSEKI_SETUP_CACHE_TTL={raw!r}, using {_DATASETS_CACHE_DEFAULT_TTL:g}s"
+        )
+        return _DATASETS_CACHE_DEFAULT_TTL
+
+
+_DATASETS_CACHE_TTL = _datasets_cache_ttl()
+
+
+def _read_datasets_cache(fuseki_url: str):
+    """Return the cached dataset names for fuseki_url, or None if missing or stale"""
+    try:
+        if time.time() - _DATASETS_CACHE_PATH.stat().st_mtime >= _DATASETS_CACHE_TTL:
+            return None
+        cached = json.loads(_DATASETS_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if cached.get("url") != fuseki_url:
+        return None
+    return cached.get("datasets")
+
+
+def _write_datasets_cache(fuseki_url: str, datasets: list) -> None:
+    """Persist the dataset names for fuseki_url (best effort)"""
+    if _DATASETS_CACHE_TTL <= 0:
+        return
+    try:
+        _DATASETS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _DATASETS_CACHE_PATH.write_text(
+            json.dumps({"url": fuseki_url, "datasets": datasets}), encoding="utf-8"
+        )
+    except OSError as e:
+        logger.debug(f"Could not write datasets cache: {e}")
+
+
+def _invalidate_datasets_cache() -> None:
+    """Drop the cached dataset listing"""
+    try:
+        _DATASETS_CACHE_PATH.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _invalidate_datasets_cache_on_4xx(status_code: int) -> None:
+    """Drop the cached listing when a dataset request fails with a client error"""
+    if 400 <= status_code < 500:
+        _invalidate_datasets_cache()
+
 
 def create_dataset(dataset_name: str = None) -> bool:
     """
@@ -38,19 +128,23 @@ def create_dataset(dataset_name: str = None) -> bool:
     dataset_name = dataset_name or settings.FUSEKI_DATASET
     try:
         fuseki_url = settings.FUSEKI_URL
-        auth = (settings.FUSEKI_USERNAME, settings.FUSEKI_PASSWORD)
-
-        # Check if dataset already exists
-        check_url = f"{fuseki_url}/$/datasets"
-        response = requests.get(check_url, auth=auth)
 
-        if response.status_code == 200:
-            datasets = response.json()
-            existing_datasets = [ds.get("ds.name", "").strip("/") for ds in datasets.get("datasets", [])]
-
-            if dataset_name in existing_datasets:
-                logger.info(f"Dataset '{dataset_name}' already exists")
-                return True
+        # Check if dataset already exists (from a fresh on-disk listing if any)
+        existing_datasets = _read_datasets_cache(fuseki_url)
+        if existing_datasets is None:
+            check_url = f"{fuseki_url}/$/datasets"
+            response = _session.get(check_url)
+
+            if response.status_code == 200:
+                datasets = response.json()
+                existing_datasets = [ds.get("ds.name", "").strip("/") for ds in datasets.get("datasets", [])]
+                _write_datasets_cache(fuseki_url, existing_datasets)
+            else:
+                _invalidate_datasets_cache_on_4xx(response.status_code)
+
+        if existing_datasets and dataset_name in existing_datasets:
+            logger.info(f"Dataset '{dataset_name}' already exists")
+            return True
 
         # Create new dataset
         logger.info(f"Creating dataset '{dataset_name}'...")
@@ -61,12 +155,14 @@ def create_dataset(dataset_name: str = None) -> bool:
             "dbType": "tdb2"
         }
 
-        response = requests.post(
+        response = _session.post(
             create_url,
-            data=data,
-            auth=auth
+            data=data
         )
 
+        # The cached listing no longer matches the server either way
+        _invalidate_datasets_cache()
+
         if response.status_code in [200, 201]:
             logger.info(f"✓ Dataset '{dataset_name}' created successfully")
             return True
@@ -94,29 +190,37 @@ def load_ontology(dataset_name: str = None) -> bool:
         logger.info("Loading Twin ontology...")
 
         fuseki_url = settings.FUSEKI_URL
-        auth = (settings.FUSEKI_USERNAME, settings.FUSEKI_PASSWORD)
 
         # Get ontology graph
         ontology = get_twin_ontology()
 
-        # Serialize to Turtle
-        turtle_data = ontology.serialize(format="turtle")
-
-        # Upload to Fuseki
+        # Upload to Fuseki, streaming N-Triples chunks (chunked transfer encoding)
         data_url = f"{fuseki_url}/{dataset_name}/data"
-        headers = {"Content-Type": "text/turtle"}
+        headers = {"Content-Type": "application/n-triples"}
 
-        response = requests.post(
+        response = _session.post(
             data_url,
-            data=turtle_data,
-            headers=headers,
-            auth=auth
+            data=iter_ntriples(ontology),
+            headers=headers
         )
 
+        if 400 <= response.status_code < 500:
+            # e.g. 404 when the dataset was deleted while the listing was cached:
+            # recreate it from a fresh listing and retry the upload once
+            _invalidate_datasets_cache()
+            logger.warning(f"Ontology upload returned {response.status_code}, re-checking dataset...")
+            if create_dataset(dataset_name):
+                response = _session.post(
+                    data_url,
+                    data=iter_ntriples(ontology),
+                    headers=headers
+                )
+
         if response.status_code in [200, 201, 204]:
             logger.info(f"✓ Twin ontology loaded successfully ({len(ontology)} triples)")
             return True
         else:
+            _invalidate_datasets_cache_on_4xx(response.status_code)
             logger.error(f"✗ Failed to load ontology: {response.status_code} - {response.text}")
             return False
 
@@ -125,47 +229,85 @@ def load_ontology(dataset_name: str = None) -> bool:
         return False
 
 
-def verify_setup(dataset_name: str = None) -> bool:
+def _stats_triple_count(fuseki_url: str, dataset_name: str):
+    """
+    Read the dataset's triple count from GET /$/stats/{dataset}, if exposed
+
+    Stock Fuseki only reports request counters there; some builds also add a
+    triple count (top level or under "tdb"). Returns None when it is absent
+    or the endpoint is unavailable, so callers fall back to COUNT(*).
+    """
+    try:
+        response = _session.get(f"{fuseki_url}/$/stats/{dataset_name}")
+        if response.status_code != 200:
+            _invalidate_datasets_cache_on_4xx(response.status_code)
+            return None
+        entry = response.json().get("datasets", {}).get(f"/{dataset_name}", {})
+    except (requests.RequestException, ValueError, AttributeError):
+        return None
+
+    for section in (entry, entry.get("tdb") or {}):
+        for key in ("triples", "NumTriples"):
+            if isinstance(section.get(key), int):
+                return section[key]
+    return None
+
+
+def verify_setup(dataset_name: str = None, count_triples: bool = None) -> bool:
     """
     Verify the setup by running a test query
 
+    By default this is a fully bound ASK that the Twin ontology is present,
+    answered from an index. When count_triples is set (or the
+    FUSEKI_SETUP_COUNT environment variable is set) the triple count is read
+    from the dataset stats if the server exposes it, and only otherwise from
+    a full COUNT(*) scan.
+
     Args:
         dataset_name: Name of the dataset
+        count_triples: Report the number of triples instead of just checking
 
     Returns:
         bool: True if verification successful
     """
     dataset_name = dataset_name or settings.FUSEKI_DATASET
+    if count_triples is None:
+        count_triples = bool(os.environ.get("FUSEKI_SETUP_COUNT"))
     try:
         logger.info("Verifying setup...")
 
         fuseki_url = settings.FUSEKI_URL
-        auth = (settings.FUSEKI_USERNAME, settings.FUSEKI_PASSWORD)
 
-        # Test query: Count triples
-        query = """
-        SELECT (COUNT(*) as ?count)
-        WHERE {
-            ?s ?p ?o
-        }
-        """
+        if count_triples:
+            count = _stats_triple_count(fuseki_url, dataset_name)
+            if count is not None:
+                logger.info(f"✓ Setup verified: {count} triples in database")
+                return True
+
+        query = _COUNT_QUERY if count_triples else _ASK_QUERY
 
         query_url = f"{fuseki_url}/{dataset_name}/query"
         headers = {"Accept": "application/sparql-results+json"}
 
-        response = requests.post(
+        response = _session.post(
             query_url,
             data={"query": query},
-            headers=headers,
-            auth=auth
+            headers=headers
         )
 
         if response.status_code == 200:
             results = response.json()
-            count = results["results"]["bindings"][0]["count"]["value"]
-            logger.info(f"✓ Setup verified: {count} triples in database")
-            return True
+            if count_triples:
+                count = results["results"]["bindings"][0]["count"]["value"]
+                logger.info(f"✓ Setup verified: {count} triples in database")
+                return True
+            if results.get("boolean"):
+                logger.info("✓ Setup verified: Twin ontology present in database")
+                return True
+            logger.error("✗ Verification failed: Twin ontology not found in database")
+            return False
         else:
+            _invalidate_datasets_cache_on_4xx(response.status_code)
             logger.error(f"✗ Verification failed: {response.status_code} - {response.text}")
             return False
 
@@ -183,20 +325,23 @@ def main():
     logger.info(f"Dataset: {settings.FUSEKI_DATASET}")
     logger.info("=" * 60)
 
-    # Step 1: Create dataset
-    if not create_dataset():
-        logger.error("Setup failed at dataset creation")
-        sys.exit(1)
-
-    # Step 2: Load ontology
-    if not load_ontology():
-        logger.error("Setup failed at ontology loading")
-        sys.exit(1)
-
-    # Step 3: Verify
-    if not verify_setup():
-        logger.error("Setup verification failed")
-        sys.exit(1)
+    try:
+        # Step 1: Create dataset
+        if not create_dataset():
+            logger.error("Setup failed at dataset creation")
+            sys.exit(1)
+
+        # Step 2: Load ontology
+        if not load_ontology():
+            logger.error("Setup failed at ontology loading")
+            sys.exit(1)
+
+        # Step 3: Verify
+        if not verify_setup():
+            logger.error("Setup verification failed")
+            sys.exit(1)
+    finally:
+        _session.close()
 
     logger.info("=" * 60)
     logger.info("✓ Twin Fuseki setup completed successfully!")
@@ -0,0 +1,57 @@
+"""
+Shared entry point for the DTDL test scripts
+
+Buffers each script's report and writes it one section at a time (a section
+ends with a blank line), with -q/--quiet to suppress it for timing runs.
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+from typing import Callable, List, Optional, TextIO
+
+
+class _SectionWriter(io.TextIOBase):
+    """Collects print() output and forwards it to target once per section"""
+
+    def __init__(self, target: Optional[TextIO]):
+        self._target = target
+        self._parts: List[str] = []
+        self._last = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self._parts.append(text)
+            # print() emits a lone "\n" for a blank line, which closes a section
+            if text == "\n" and self._last.endswith("\n"):
+                self.flush()
+            self._last = text
+        return len(text)
+
+    def flush(self):
+        if self._target is None:
+            self._parts.clear()
+            return
+        if self._parts:
+            self._target.write("".join(self._parts))
+            self._parts.clear()
+        self._target.flush()
+
+
+def run_main(main: Callable[[], None], doc: Optional[str]):
+    """Parse -q/--quiet and run main() with its report buffered per section"""
+    parser = argparse.ArgumentParser(description=doc.strip().splitlines()[0] if doc else None)
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="suppress the report and only run the checks")
+    args = parser.parse_args()
+
+    writer = _SectionWriter(None if args.quiet else sys.stdout)
+    try:
+        with contextlib.redirect_stdout(writer):
+            main()
+    finally:
+        writer.flush()
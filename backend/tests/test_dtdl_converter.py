@@ -3,15 +3,22 @@ Test script for DTDL Converter Service
 
 Demonstrates conversion between DTDL and Twin formats.
 Run this from the backend directory: python test_dtdl_converter.py
+Pass -q/--quiet to suppress the report (e.g. for timing runs).
 """
 
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.services.dtdl_converter_service import DTDLConverterService
+from tests._harness import run_main
+
+# First "name: <value>" in a generated YAML document
+_NAME_RE = re.compile(r"name: ([^\n]*)")
 
 
 def main():
@@ -48,7 +55,7 @@ def main():
         dtmi="dtmi:iodt2:HumiditySensor;1"
     )
     print("   Generated YAML templates for HumiditySensor")
-    print("   Interface name:", result2["interface_yaml"].split("name: ")[1].split("\n")[0])
+    print("   Interface name:", _NAME_RE.search(result2["interface_yaml"]).group(1))
     print()
 
     # Test Case 3: Convert Weather Station (component-based)
@@ -115,13 +122,20 @@ def main():
         "dtmi:iodt2:ActuatorTwin;1",
         "dtmi:iodt2:GatewayTwin;1"
     ]
-    for dtmi in base_interfaces:
-        try:
-            result = converter.dtdl_to_twin_template(dtmi)
-            interface_name = result["interface_yaml"].split("name: ")[1].split("\n")[0]
+    # Conversions are independent; run them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=len(base_interfaces)) as executor:
+        futures = [
+            (dtmi, executor.submit(converter.dtdl_to_twin_template, dtmi))
+            for dtmi in base_interfaces
+        ]
+        for dtmi, future in futures:
+            error = future.exception()
+            if error is not None:
+                print(f"   [FAIL] {dtmi}: {error}")
+                continue
+            result = future.result()
+            interface_name = _NAME_RE.search(result["interface_yaml"]).group(1)
             print(f"   [OK] {dtmi} -> {interface_name}")
-        except Exception as e:
-            print(f"   [FAIL] {dtmi}: {e}")
     print()
 
     # Test Case 8: Schema conversion test
@@ -165,4 +179,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_main(main, __doc__)
@@ -3,6 +3,7 @@ Test script for DTDL Loader Service
 
 Demonstrates DTDL library loading and searching capabilities.
 Run this from the backend directory: python test_dtdl_loader.py
+Pass -q/--quiet to suppress the report (e.g. for timing runs).
 """
 
 import sys
@@ -11,7 +12,8 @@ from pathlib import Path
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.services.dtdl_loader_service import DTDLLoaderService
+from app.services.dtdl_loader_service import get_dtdl_loader
+from tests._harness import run_main
 
 
 def main():
@@ -22,7 +24,7 @@ def main():
 
     # Initialize loader
     print("1. Initializing DTDL Loader...")
-    loader = DTDLLoaderService()
+    loader = get_dtdl_loader()
     print(f"   [OK] Loaded {len(loader._interfaces_cache)} interfaces")
     print()
 
@@ -90,10 +92,10 @@ def main():
         "notadtmi:test;1",  # Wrong prefix
         "dtmi:test;0",  # Invalid version
     ]
-    for dtmi in test_dtmis:
-        is_valid = loader.validate_dtmi(dtmi)
-        status = "[OK] Valid" if is_valid else "[X] Invalid"
-        print(f"   {status}: {dtmi}")
+    print("\n".join(
+        f"   {'[OK] Valid' if is_valid else '[X] Invalid'}: {dtmi}"
+        for dtmi, is_valid in zip(test_dtmis, map(loader.validate_dtmi, test_dtmis))
+    ))
     print()
 
     # Get component-based interface
@@ -127,4 +129,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_main(main, __doc__)
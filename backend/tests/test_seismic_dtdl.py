@@ -6,6 +6,8 @@ Tests the newly added seismic domain interfaces:
 - Street
 - Base Station
 - Seismic Sensor
+
+Pass -q/--quiet to suppress the report (e.g. for timing runs).
 """
 
 import sys
@@ -15,6 +17,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.services.dtdl_loader_service import get_dtdl_loader
+from tests._harness import run_main
 
 
 def print_section(title):
@@ -57,10 +60,13 @@ def main():
         print(f"   Extends: {building.get('extends', 'None')}")
 
         # Count contents
-        contents = building.get('contents', [])
-        telemetry = [c for c in contents if c.get('@type') == 'Telemetry']
-        properties = [c for c in contents if c.get('@type') == 'Property']
-        commands = [c for c in contents if c.get('@type') == 'Command']
+        telemetry, properties, commands = [], [], []
+        buckets = {'Telemetry': telemetry, 'Property': properties, 'Command': commands}
+        for c in building.get('contents', []):
+            content_type = c.get('@type')
+            bucket = buckets.get(content_type) if isinstance(content_type, str) else None
+            if bucket is not None:
+                bucket.append(c)
 
         print(f"   Telemetry: {len(telemetry)} ({', '.join([t['name'] for t in telemetry])})")
         print(f"   Properties: {len(properties)} ({', '.join([p['name'] for p in properties])})")
@@ -113,4 +119,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_main(main, __doc__)